@@ -8,9 +8,18 @@ class AdversarialSearch:
     def __init__(self, game: Game):
         self.game = game
 
-    def best_move(self, depth: int = 0):
-        """Find best move using selected strategy"""
-        return self.strategy.find_best_move(self.game, depth)
+    def best_move(self, depth: int = 0, time_limit: float | None = None):
+        """
+        Find best move using selected strategy. `depth` limits the plies
+        searched, 0 meaning to the end of the game. With a `time_limit` in
+        seconds, strategies that support it deepen iteratively and return
+        the best move of the deepest search completed in time.
+        """
+        if time_limit is None:
+            return self.strategy.find_best_move(self.game, depth)
+        if not hasattr(self.strategy, "iterative_deepening"):
+            raise TypeError(f"{self.get_strategy_name()} does not support a time limit")
+        return self.strategy.iterative_deepening(self.game, depth, time_limit)
 
     def set_strategy(self, strategy_name: str):
         """Change strategy by name"""
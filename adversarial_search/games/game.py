@@ -2,7 +2,20 @@ from abc import ABC, abstractmethod
 
 
 class Game(ABC):
-    """Simple game interface"""
+    """
+    Simple game interface.
+
+    Games may also expose a `zobrist` attribute: a 64-bit hash of the
+    position, side to move included, kept up to date by `make_move`.
+    Strategies use it to key their transposition tables.
+
+    Games that implement `unmake_move(move)`, restoring the position from
+    before `make_move(move)`, are searched in place; others are copied
+    with `copy()` at every node.
+
+    A `move_priority(move)` method, higher for moves worth searching
+    first, lets alpha-beta try likely good moves early.
+    """
 
     @abstractmethod
     def is_terminal(self) -> bool:
@@ -1,71 +1,152 @@
+import random
 from .game import Game
 from ..adversarial_search import AdversarialSearch
 
 
+# Squares are numbered 3 * row + col, and each side's marks are a 9-bit mask
+FULL = 0b111111111
+SQUARES = {(row, col): 3 * row + col for row in range(3) for col in range(3)}
+WIN_MASKS = (
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    0b100010001,
+    0b001010100,
+)
+
+# WINS[marks] tells whether a side holding `marks` has three in a row
+WINS = [any(marks & win == win for win in WIN_MASKS) for marks in range(FULL + 1)]
+
+# MOVES[empty] holds the (row, col) of every square set in `empty`
+MOVES = [
+    tuple(divmod(square, 3) for square in range(9) if empty >> square & 1)
+    for empty in range(FULL + 1)
+]
+
+# PRIORITY[move] counts the win lines through a square: 4 for the center,
+# 3 for corners and 2 for edges
+PRIORITY = {
+    move: sum(win >> square & 1 for win in WIN_MASKS)
+    for move, square in SQUARES.items()
+}
+
+# Zobrist keys for each player's mark on each square, and for "O" to move
+_keys = random.Random(0x7AC7AC).getrandbits
+ZOBRIST_KEYS = {player: tuple(_keys(64) for _ in range(9)) for player in "XO"}
+ZOBRIST_O_TO_MOVE = _keys(64)
+del _keys
+
+
 class TicTacToe(Game):
-    """Simple TicTacToe implementation"""
+    """
+    Simple TicTacToe implementation.
+
+    The position is kept as two bitboards, `x_marks` and `o_marks`, so
+    wins, full boards and moves are table lookups on 9-bit masks. `board`
+    renders it as rows of "X", "O" and " "; edits to that list do not
+    change the game.
+    """
 
     def __init__(self, board=None, player="X"):
-        self.board = board or [[" " for _ in range(3)] for _ in range(3)]
+        self.x_marks = 0
+        self.o_marks = 0
+        for (row, col), square in SQUARES.items():
+            cell = board[row][col] if board else " "
+            if cell == "X":
+                self.x_marks |= 1 << square
+            elif cell == "O":
+                self.o_marks |= 1 << square
         self.player = player
+        self.zobrist = self._hash()
+
+    @property
+    def board(self):
+        """The board as rows of "X", "O" and " " cells"""
+        return [[self._cell(3 * row + col) for col in range(3)] for row in range(3)]
+
+    def _cell(self, square):
+        if self.x_marks >> square & 1:
+            return "X"
+        if self.o_marks >> square & 1:
+            return "O"
+        return " "
+
+    def _hash(self):
+        """Zobrist hash of the board and side to move"""
+        key = ZOBRIST_O_TO_MOVE if self.player == "O" else 0
+        for square in range(9):
+            if self.x_marks >> square & 1:
+                key ^= ZOBRIST_KEYS["X"][square]
+            elif self.o_marks >> square & 1:
+                key ^= ZOBRIST_KEYS["O"][square]
+        return key
 
     def is_terminal(self) -> bool:
         """Check if game is over"""
-        return self._check_winner() is not None or self._is_full()
+        return (
+            WINS[self.x_marks]
+            or WINS[self.o_marks]
+            or self.x_marks | self.o_marks == FULL
+        )
 
     def get_moves(self) -> list:
         """Get all possible moves (row, col)"""
-        moves = []
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == " ":
-                    moves.append((i, j))
-        return moves
+        return list(MOVES[FULL ^ (self.x_marks | self.o_marks)])
 
     def make_move(self, move):
         """Make a move at (row, col)"""
-        row, col = move
-        self.board[row][col] = self.player
-        self.player = "O" if self.player == "X" else "X"
+        square = SQUARES[move]
+        if self.player == "X":
+            self.x_marks |= 1 << square
+            self.zobrist ^= ZOBRIST_KEYS["X"][square] ^ ZOBRIST_O_TO_MOVE
+            self.player = "O"
+        else:
+            self.o_marks |= 1 << square
+            self.zobrist ^= ZOBRIST_KEYS["O"][square] ^ ZOBRIST_O_TO_MOVE
+            self.player = "X"
+
+    def unmake_move(self, move):
+        """Take back the move at (row, col)"""
+        square = SQUARES[move]
+        if self.x_marks >> square & 1:
+            self.x_marks ^= 1 << square
+            self.player = "X"
+        else:
+            self.o_marks ^= 1 << square
+            self.player = "O"
+        self.zobrist ^= ZOBRIST_KEYS[self.player][square] ^ ZOBRIST_O_TO_MOVE
+
+    def move_priority(self, move) -> int:
+        """Ordering hint: center first, then corners, then edges"""
+        return PRIORITY[move]
 
     def evaluate(self) -> int:
         """Evaluate board position"""
-        winner = self._check_winner()
-        if winner == "X":
-            return -1
-        elif winner == "O":
-            return 1
-        else:
-            return 0
+        return WINS[self.o_marks] - WINS[self.x_marks]
 
     def copy(self):
         """Create a copy of the game state"""
-        new_board = [row[:] for row in self.board]
-        return TicTacToe(new_board, self.player)
+        game = TicTacToe.__new__(TicTacToe)
+        game.x_marks = self.x_marks
+        game.o_marks = self.o_marks
+        game.player = self.player
+        game.zobrist = self.zobrist
+        return game
 
     def _check_winner(self):
         """Check for winner"""
-        # Rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] != " ":
-                return row[0]
-
-        # Columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] != " ":
-                return self.board[0][col]
-
-        # Diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != " ":
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != " ":
-            return self.board[0][2]
-
+        if WINS[self.x_marks]:
+            return "X"
+        if WINS[self.o_marks]:
+            return "O"
         return None
 
     def _is_full(self):
         """Check if board is full"""
-        return all(cell != " " for row in self.board for cell in row)
+        return self.x_marks | self.o_marks == FULL
 
     def display(self):
         """Display the board"""
@@ -75,8 +156,8 @@ class TicTacToe(Game):
                 print("---------")
 
 
-def play_interactive(strategy_name: str = "alphabeta"):
-    """Interactive game with strategy selection"""
+def play_interactive(strategy_name: str = "alphabeta", time_limit: float | None = None):
+    """Interactive game with strategy selection, and optional seconds per AI move"""
     game = TicTacToe()
     ai = AdversarialSearch(game)
     ai.set_strategy(strategy_name)
@@ -103,7 +184,7 @@ def play_interactive(strategy_name: str = "alphabeta"):
                 continue
         else:
             print("AI thinking...")
-            move = ai.best_move()
+            move = ai.best_move(time_limit=time_limit)
             print(f"AI plays: {move}")
             game.make_move(move)
 
@@ -1,5 +1,16 @@
 from .strategy import Strategy
 from .minimax import MinimaxStrategy
 from .alpha_beta import AlphaBetaStrategy
+from .move_ordering import MoveOrdering
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable
 
-__all__ = ["Strategy", "MinimaxStrategy", "AlphaBetaStrategy"]
+__all__ = [
+    "Strategy",
+    "MinimaxStrategy",
+    "AlphaBetaStrategy",
+    "MoveOrdering",
+    "TranspositionTable",
+    "EXACT",
+    "LOWER",
+    "UPPER",
+]
@@ -1,9 +1,62 @@
+import time
+from itertools import count
+from .move_ordering import MoveOrdering
 from .strategy import Strategy
+from .transposition import EXACT, FULL_DEPTH, LOWER, UPPER
 from ..games import Game
 
 
+class _Timeout(Exception):
+    """Raised inside a search when its time limit runs out"""
+
+
+def _move_to_front(moves: list, move) -> bool:
+    """Move `move` to the front of `moves`; False if it is not there"""
+    if move not in moves:
+        return False
+    moves.remove(move)
+    moves.insert(0, move)
+    return True
+
+
 class AlphaBetaStrategy(Strategy):
-    """Alpha-Beta pruning algorithm implementation"""
+    """
+    Alpha-Beta pruning algorithm implementation.
+
+    `depth` counts the plies searched below a position, the root move
+    included, so depth 1 evaluates the root's children. A depth that runs
+    below zero never cuts off: 0, the default of `AdversarialSearch`,
+    searches to the end of the game.
+
+    Table entries narrow the window or answer a position outright when
+    they were searched at least as deep, and their best move is tried
+    first. Subtrees that never reached the depth limit are stored as
+    complete. Games with `unmake_move` are searched in place on one copy
+    of the root.
+
+    Behind the table and PV moves, moves are sorted by `ordering`, a
+    `MoveOrdering` (the default one when True, none when False).
+    `cutoffs` counts the nodes that failed high or low, and
+    `first_move_cutoffs` those where the first move searched was enough.
+    """
+
+    def __init__(
+        self,
+        table_size: int = 1 << 16,
+        replacement: str = "depth",
+        ordering: MoveOrdering | bool = True,
+    ):
+        super().__init__(table_size, replacement)
+        self.ordering = MoveOrdering() if ordering is True else ordering or None
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.pv = []
+        self.completed_depth = 0
+        self._deadline = None
+        self._root_depth = 0
+        self._lines = None
+        self._follow_pv = False
+        self._horizon = False
 
     def solve(
         self,
@@ -14,47 +67,201 @@ class AlphaBetaStrategy(Strategy):
         beta: float = float("inf"),
     ) -> int:
         """Solve using alpha-beta pruning algorithm"""
-        if depth == 0 or game.is_terminal():
+        self.nodes += 1
+        deadline = self._deadline
+        if (
+            deadline is not None
+            and not self.nodes & 255
+            and time.perf_counter() > deadline
+        ):
+            raise _Timeout
+        ply = self._root_depth - depth
+        lines = self._lines
+        if lines is not None:
+            lines[ply] = []
+        if game.is_terminal():
+            return game.evaluate()
+        if depth == 0:
+            self._horizon = True
             return game.evaluate()
 
+        horizon = self._horizon
+        self._horizon = False
+        moves = game.get_moves()
+        if self.ordering is not None:
+            self.ordering.order(game, moves, ply)
+        remaining = depth if depth > 0 else FULL_DEPTH
+        key = self._key(game, maximizing)
+        if key is not None:
+            entry = self.table.probe(key)
+            if entry is not None:
+                entry_depth, flag, value, move = entry
+                if entry_depth >= remaining:
+                    self._horizon = entry_depth < FULL_DEPTH
+                    if flag == EXACT:
+                        self._horizon |= horizon
+                        return value
+                    if flag == LOWER:
+                        alpha = max(alpha, value)
+                    else:
+                        beta = min(beta, value)
+                    if beta <= alpha:
+                        self._horizon |= horizon
+                        return value
+                _move_to_front(moves, move)
+        if lines is not None and self._follow_pv:
+            pv = self.pv
+            if ply >= len(pv) or not _move_to_front(moves, pv[ply]):
+                self._follow_pv = False
+        alpha_searched, beta_searched = alpha, beta
+
+        best_move = None
+        in_place = hasattr(game, "unmake_move")
         if maximizing:
             max_eval = float("-inf")
-            for move in game.get_moves():
-                game_copy = game.copy()
-                game_copy.make_move(move)
-                eval_score = self.solve(game_copy, depth - 1, False, alpha, beta)
-                max_eval = max(max_eval, eval_score)
+            for index, move in enumerate(moves):
+                child = game if in_place else game.copy()
+                child.make_move(move)
+                eval_score = self.solve(child, depth - 1, False, alpha, beta)
+                if in_place:
+                    game.unmake_move(move)
+                self._follow_pv = False
+                if eval_score > max_eval:
+                    max_eval = eval_score
+                    best_move = move
+                    if lines is not None:
+                        lines[ply] = [move] + lines[ply + 1]
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(move, index, ply, depth)
                     break  # Beta cutoff
-            return max_eval
+            value = max_eval
         else:
             min_eval = float("inf")
-            for move in game.get_moves():
-                game_copy = game.copy()
-                game_copy.make_move(move)
-                eval_score = self.solve(game_copy, depth - 1, True, alpha, beta)
-                min_eval = min(min_eval, eval_score)
+            for index, move in enumerate(moves):
+                child = game if in_place else game.copy()
+                child.make_move(move)
+                eval_score = self.solve(child, depth - 1, True, alpha, beta)
+                if in_place:
+                    game.unmake_move(move)
+                self._follow_pv = False
+                if eval_score < min_eval:
+                    min_eval = eval_score
+                    best_move = move
+                    if lines is not None:
+                        lines[ply] = [move] + lines[ply + 1]
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(move, index, ply, depth)
                     break  # Alpha cutoff
-            return min_eval
+            value = min_eval
+
+        subtree_horizon = self._horizon
+        self._horizon = horizon or subtree_horizon
+        if key is not None:
+            if value <= alpha_searched:
+                flag = UPPER
+            elif value >= beta_searched:
+                flag = LOWER
+            else:
+                flag = EXACT
+            stored_depth = remaining if subtree_horizon else FULL_DEPTH
+            self.table.store(key, stored_depth, flag, value, best_move)
+        return value
+
+    def _record_cutoff(self, move, index: int, ply: int, depth: int):
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+        if self.ordering is not None:
+            self.ordering.record_cutoff(move, ply, depth)
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Fraction of cutoffs made by the first move searched"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def find_best_move(self, game: Game, depth: int, time_limit: float | None = None):
+        """
+        Find best move using alpha-beta pruning.
+        With a `time_limit` in seconds, deepens iteratively up to `depth`.
+        """
+        if time_limit is not None:
+            return self.iterative_deepening(game, depth, time_limit)
+        if hasattr(game, "unmake_move"):
+            game = game.copy()
+        if self.ordering is not None:
+            self.ordering.age()
+        return self._search_root(game, depth)
+
+    def iterative_deepening(
+        self, game: Game, max_depth: int = 0, time_limit: float | None = None
+    ):
+        """
+        Search to depth 1, 2, 3, ... up to `max_depth` (0 for no limit)
+        until the game is solved or `time_limit` seconds have passed, trying
+        each iteration's principal variation first in the next. Returns the
+        best move of the deepest completed iteration, which `completed_depth`
+        and `pv` describe. The first iteration always completes.
+        """
+        if hasattr(game, "unmake_move"):
+            game = game.copy()
+        start = time.perf_counter()
+        self.pv = []
+        self.completed_depth = 0
+        if self.ordering is not None:
+            self.ordering.age()
+        best_move = None
+        try:
+            for depth in count(1):
+                if max_depth > 0 and depth > max_depth:
+                    break
+                if time_limit is not None and depth > 1:
+                    if time.perf_counter() - start >= time_limit:
+                        break
+                    self._deadline = start + time_limit
+                self._lines = [[] for _ in range(depth + 1)]
+                self._horizon = False
+                self._follow_pv = True
+                best_move = self._search_root(game, depth)
+                self.pv = self._lines[0]
+                self.completed_depth = depth
+                if not self._horizon:
+                    break  # Solved to the end of the game
+        except _Timeout:
+            pass
+        finally:
+            self._deadline = None
+            self._lines = None
+        return best_move
 
-    def find_best_move(self, game: Game, depth: int):
-        """Find best move using alpha-beta pruning"""
+    def _search_root(self, game: Game, depth: int):
+        """Best root move, searched `depth` plies deep"""
+        self._root_depth = depth
+        moves = game.get_moves()
+        if self.ordering is not None:
+            self.ordering.order(game, moves, 0)
+        if self._lines is not None and self.pv:
+            _move_to_front(moves, self.pv[0])
         best_score = float("-inf")
         best_move = None
         alpha = float("-inf")
         beta = float("inf")
+        in_place = hasattr(game, "unmake_move")
 
-        for move in game.get_moves():
-            game_copy = game.copy()
-            game_copy.make_move(move)
-            score = self.solve(game_copy, depth - 1, False, alpha, beta)
+        for move in moves:
+            child = game if in_place else game.copy()
+            child.make_move(move)
+            score = self.solve(child, depth - 1, False, alpha, beta)
+            if in_place:
+                game.unmake_move(move)
+            self._follow_pv = False
 
             if score > best_score:
                 best_score = score
                 best_move = move
+                if self._lines is not None:
+                    self._lines[0] = [move] + self._lines[1]
             alpha = max(alpha, score)
 
         return best_move
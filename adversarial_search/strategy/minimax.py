@@ -1,41 +1,70 @@
 from .strategy import Strategy
+from .transposition import EXACT, FULL_DEPTH
 from ..games import Game
 
 
 class MinimaxStrategy(Strategy):
-    """Minimax algorithm implementation"""
+    """
+    Minimax algorithm implementation.
+    Searches to the end of the game, so every position reached again
+    through a transposition is answered exactly from the table. Games
+    with `unmake_move` are searched in place on one copy of the root.
+    """
 
     def solve(self, game: Game, depth: int, maximizing: bool) -> int:
         """Solve using minimax algorithm"""
-        if game.is_terminal():
-            return game.evaluate()
+        self.nodes += 1
+        key = self._key(game, maximizing)
+        if key is not None:
+            entry = self.table.probe(key)
+            if entry is not None:
+                return entry[2]
 
-        if maximizing:
-            max_eval = float("-inf")
+        best_move = None
+        in_place = hasattr(game, "unmake_move")
+        if game.is_terminal():
+            value = game.evaluate()
+        elif maximizing:
+            value = float("-inf")
             for move in game.get_moves():
-                game_copy = game.copy()
-                game_copy.make_move(move)
-                eval_score = self.solve(game_copy, depth + 1, False)
-                max_eval = max(max_eval, eval_score)
-            return max_eval
+                child = game if in_place else game.copy()
+                child.make_move(move)
+                eval_score = self.solve(child, depth + 1, False)
+                if in_place:
+                    game.unmake_move(move)
+                if eval_score > value:
+                    value = eval_score
+                    best_move = move
         else:
-            min_eval = float("inf")
+            value = float("inf")
             for move in game.get_moves():
-                game_copy = game.copy()
-                game_copy.make_move(move)
-                eval_score = self.solve(game_copy, depth + 1, True)
-                min_eval = min(min_eval, eval_score)
-            return min_eval
+                child = game if in_place else game.copy()
+                child.make_move(move)
+                eval_score = self.solve(child, depth + 1, True)
+                if in_place:
+                    game.unmake_move(move)
+                if eval_score < value:
+                    value = eval_score
+                    best_move = move
+
+        if key is not None:
+            self.table.store(key, FULL_DEPTH, EXACT, value, best_move)
+        return value
 
     def find_best_move(self, game: Game, depth: int):
         """Find best move using minimax"""
+        in_place = hasattr(game, "unmake_move")
+        if in_place:
+            game = game.copy()
         best_score = float("-inf")
         best_move = None
 
         for move in game.get_moves():
-            game_copy = game.copy()
-            game_copy.make_move(move)
-            score = self.solve(game_copy, depth + 1, False)
+            child = game if in_place else game.copy()
+            child.make_move(move)
+            score = self.solve(child, depth + 1, False)
+            if in_place:
+                game.unmake_move(move)
 
             if score > best_score:
                 best_score = score
@@ -0,0 +1,62 @@
+from ..games import Game
+
+
+class MoveOrdering:
+    """
+    Orders moves for alpha-beta search, most promising first.
+
+    Moves rank by, in turn:
+    - `killers` slots per ply, holding the last moves that caused a cutoff
+      at that ply;
+    - a `history` score per move, raised by the square of the remaining
+      depth whenever the move causes a cutoff;
+    - the game's own `move_priority(move)` hint, when it has one and
+      `hint` is set.
+    Set `killers` to 0 or `history` to False to leave that heuristic out.
+    """
+
+    def __init__(self, killers: int = 2, history: bool = True, hint: bool = True):
+        self.killers = killers
+        self.history = history
+        self.hint = hint
+        self.clear()
+
+    def clear(self):
+        """Forget all killer moves and history scores"""
+        self.killer_moves = {}
+        self.history_scores = {}
+
+    def age(self):
+        """Halve history scores and forget killers before a new search"""
+        self.killer_moves = {}
+        self.history_scores = {
+            move: score // 2 for move, score in self.history_scores.items() if score > 1
+        }
+
+    def order(self, game: Game, moves: list, ply: int):
+        """Sort `moves` in place for the node at `ply` plies below the root"""
+        killers = self.killer_moves.get(ply, ())
+        history = self.history_scores
+        hint = getattr(game, "move_priority", None) if self.hint else None
+
+        def rank(move):
+            killer = len(killers) - killers.index(move) if move in killers else 0
+            return (
+                killer,
+                history.get(move, 0),
+                hint(move) if hint is not None else 0,
+            )
+
+        moves.sort(key=rank, reverse=True)
+
+    def record_cutoff(self, move, ply: int, depth: int):
+        """Credit `move` for a cutoff at `ply` with `depth` plies left"""
+        if self.killers:
+            killers = self.killer_moves.setdefault(ply, [])
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[self.killers :]
+        if self.history:
+            weight = depth * depth if depth > 0 else 1
+            self.history_scores[move] = self.history_scores.get(move, 0) + weight
@@ -1,9 +1,30 @@
 from abc import ABC, abstractmethod
 from ..games import Game
+from .transposition import MAXIMIZING_KEY, TranspositionTable
 
 
 class Strategy(ABC):
-    """Abstract strategy for adversarial search"""
+    """
+    Abstract strategy for adversarial search.
+
+    Results for games exposing a `zobrist` hash are cached in `table`, a
+    `TranspositionTable` of `table_size` entries that persists between
+    moves; `table_size=0` disables it. `nodes` counts the positions
+    searched.
+    """
+
+    def __init__(self, table_size: int = 1 << 16, replacement: str = "depth"):
+        self.table = TranspositionTable(table_size, replacement) if table_size else None
+        self.nodes = 0
+
+    def _key(self, game: Game, maximizing: bool):
+        """Transposition key of `game` searched as a max or min node, or None"""
+        if self.table is None:
+            return None
+        key = getattr(game, "zobrist", None)
+        if key is not None and maximizing:
+            key ^= MAXIMIZING_KEY
+        return key
 
     @abstractmethod
     def solve(self, game: Game, depth: int, maximizing: bool) -> int:
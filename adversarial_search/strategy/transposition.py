@@ -0,0 +1,77 @@
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Remaining depth recorded for positions searched to the end of the game
+FULL_DEPTH = 1 << 30
+
+# XORed into keys of maximizing nodes, whose values differ from minimizing ones
+MAXIMIZING_KEY = 0x9E3779B97F4A7C15
+
+REPLACEMENT_POLICIES = ("depth", "always")
+
+
+class TranspositionTable:
+    """
+    Fixed-size cache of searched positions keyed by 64-bit Zobrist hashes.
+
+    An entry holds the remaining `depth` it was searched to, a `flag`
+    telling whether `value` is EXACT or only a LOWER or UPPER bound (after
+    a beta or alpha cutoff), and the best move found. Positions map to one
+    of `size` slots, rounded up to a power of two, by the low bits of their
+    key; the full key is kept to reject collisions.
+
+    When a slot is taken by another position, the "always" policy
+    overwrites it, while the "depth" policy keeps whichever entry was
+    searched deeper, so expensive results survive a flood of shallow ones.
+    `probes`, `hits`, `stores` and `overwrites` count table traffic.
+    """
+
+    def __init__(self, size=1 << 16, replacement="depth"):
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(
+                f"Unknown replacement policy '{replacement}'. "
+                f"Available: {', '.join(REPLACEMENT_POLICIES)}"
+            )
+        self.size = 1 << max(0, size - 1).bit_length()
+        self.replacement = replacement
+        self._mask = self.size - 1
+        self.clear()
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        self._keys = [None] * self.size
+        self._entries = [None] * self.size
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def probe(self, key):
+        """Returns the (depth, flag, value, move) entry of `key`, or None"""
+        self.probes += 1
+        index = key & self._mask
+        if self._keys[index] != key:
+            return None
+        self.hits += 1
+        return self._entries[index]
+
+    def store(self, key, depth, flag, value, move=None):
+        """Record a search result for `key`, subject to the replacement policy"""
+        index = key & self._mask
+        stored_key = self._keys[index]
+        if stored_key is not None and stored_key != key:
+            if self.replacement == "depth" and self._entries[index][0] > depth:
+                return
+            self.overwrites += 1
+        self._keys[index] = key
+        self._entries[index] = (depth, flag, value, move)
+        self.stores += 1
+
+    @property
+    def hit_rate(self):
+        """Fraction of probes that found their position"""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def __len__(self):
+        return self.size - self._keys.count(None)
@@ -0,0 +1,193 @@
+import json
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from .games.n_queens import NQueensState
+from .games.tsp import TSPInstance, TSPState, read_tsplib
+from .local_search import LocalSearch
+
+
+def _n_queens_state(job, rng):
+    return NQueensState.random(job.get("n", 8), rng)
+
+
+def _tsp_state(job, rng):
+    """A space-filling tour of the job's TSPLIB `instance`, or of `n` random cities"""
+    if "instance" in job:
+        instance = read_tsplib(job["instance"])
+    else:
+        instance = TSPInstance.random(job.get("n", 100), rng)
+    return TSPState.space_filling(instance)
+
+
+PROBLEMS = {
+    "n_queens": _n_queens_state,
+    "tsp": _tsp_state,
+}
+
+
+def read_jobs(path):
+    """
+    Read a JSONL file of jobs. Each line is an object with `problem`, `n`,
+    `algorithm`, `kwargs` and `seed`, all optional; jobs without an `id`
+    are numbered by their line, counting from 0.
+    """
+    jobs = []
+    with open(path) as f:
+        for index, line in enumerate(f):
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            job.setdefault("id", index)
+            jobs.append(job)
+    return jobs
+
+
+def _job_record(job):
+    """The fields of a result record that describe the job itself"""
+    return {
+        "id": job["id"],
+        "problem": job.get("problem", "n_queens"),
+        "n": job.get("n"),
+        "algorithm": job.get("algorithm", "hill_climb"),
+        "seed": job.get("seed"),
+    }
+
+
+def run_job(job):
+    """
+    Run one job and return its result record. Failures are reported in an
+    `error` field instead of raised, so one bad job does not stop a batch.
+    """
+    result = _job_record(job)
+    problem = result["problem"]
+    algorithm_name = result["algorithm"]
+    seed = result["seed"]
+    start = time.perf_counter()
+    try:
+        if problem not in PROBLEMS:
+            raise ValueError(
+                f"Unknown problem '{problem}'. Available: {', '.join(PROBLEMS)}"
+            )
+        initial_state = PROBLEMS[problem](job, random.Random(seed))
+        search = LocalSearch(
+            initial_state,
+            algorithm_name=algorithm_name,
+            seed=seed,
+            **job.get("kwargs", {}),
+        )
+        final_state = search.search()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    algorithm = search.algorithm
+    result.update(
+        {
+            "initial_value": int(initial_state.value),
+            "value": int(final_state.value),
+            "goal": bool(final_state.is_goal()),
+            "steps": getattr(algorithm, "current_step", None),
+            "evaluations": getattr(algorithm, "evaluations", None),
+            "seconds": time.perf_counter() - start,
+        }
+    )
+    return result
+
+
+def completed_ids(path):
+    """
+    Returns the ids of the jobs recorded without an `error` in the results
+    file at `path`, so failed jobs run again on resume. A line torn by a
+    crash is cut off, so appending continues from the last complete record.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    ids = set()
+    end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                result = json.loads(line)
+                job_id = result["id"]
+            except (ValueError, KeyError):
+                break
+            if "error" not in result:
+                ids.add(job_id)
+            end += len(line)
+    if end != os.path.getsize(path):
+        os.truncate(path, end)
+    return ids
+
+
+def run_batch(jobs_path, output_path, workers=1, resume=False, log=print):
+    """
+    Run every job in `jobs_path` and write one JSON result per line to
+    `output_path` as each finishes, in completion order. With `workers` > 1
+    jobs run on a process pool, keeping a couple queued per worker; if a
+    worker dies, its in-flight jobs are recorded with an `error` and the
+    pool is restarted for the rest. With `resume`, jobs already recorded
+    without an error are skipped and new results are appended. Returns the
+    number of jobs run.
+    """
+    jobs = read_jobs(jobs_path)
+    if resume:
+        done = completed_ids(output_path)
+        jobs = [job for job in jobs if job["id"] not in done]
+        log(f"Resuming: {len(done)} done, {len(jobs)} to run")
+
+    with open(output_path, "a" if resume else "w") as output:
+
+        def record(result):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            status = result.get("error") or f"value={result['value']}"
+            log(f"[{result['id']}] {result['algorithm']} {status}")
+
+        if workers is None or workers <= 1:
+            for job in jobs:
+                record(run_job(job))
+            return len(jobs)
+
+        pending_jobs = iter(jobs)
+        pending = {}
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+        def submit_next():
+            nonlocal executor
+            job = next(pending_jobs, None)
+            if job is None:
+                return
+            try:
+                future = executor.submit(run_job, job)
+            except BrokenProcessPool:
+                executor.shutdown(cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                future = executor.submit(run_job, job)
+            pending[future] = job
+
+        try:
+            for _ in range(2 * workers):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        # A worker died (OOM kill, segfault) with this job in flight
+                        result = _job_record(job)
+                        result["error"] = f"{type(e).__name__}: {e}"
+                    record(result)
+                    submit_next()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    return len(jobs)
@@ -0,0 +1,56 @@
+import argparse
+import sys
+from .suite import compare, run_suite, write_csv, write_json
+
+
+def main(argv=None):
+    """Command line entry point: `python -m local_search.bench`"""
+    parser = argparse.ArgumentParser(
+        prog="python -m local_search.bench",
+        description="Benchmark local search algorithms on seeded N-Queens boards.",
+    )
+    parser.add_argument(
+        "--algorithms", nargs="+", help="algorithm names (default: all registered)"
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[8, 16, 32])
+    parser.add_argument("--seeds", type=int, default=5, help="seeds per size")
+    parser.add_argument("--max-steps", type=int, default=1000)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc pass"
+    )
+    parser.add_argument("--json", help="write runs and summaries to this file")
+    parser.add_argument("--csv", help="write one row per run to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed median time increase over the baseline (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    runs = run_suite(
+        algorithms=args.algorithms,
+        sizes=args.sizes,
+        seeds=args.seeds,
+        max_steps=args.max_steps,
+        memory=not args.no_memory,
+    )
+
+    if args.json:
+        write_json(runs, args.json)
+    if args.csv:
+        write_csv(runs, args.csv)
+
+    if args.baseline:
+        regressions = compare(runs, args.baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import random
+import tracemalloc
+from ..games.n_queens import NQueensState
+
+
+def measure(build, count):
+    """Return (bytes, allocated blocks) per object kept alive by `build`"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [build(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+    return size / count, blocks / count
+
+
+def measure_applies(state, count):
+    """Return (bytes, allocated blocks) retained per in-place `apply`"""
+    rng = random.Random(0)
+    moves = [state.random_move(rng) for _ in range(count)]
+    working = state.copy()
+    working.apply(moves[0])
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for move in moves:
+        working.apply(move)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return size / count, blocks / count
+
+
+def measure_size(n, count):
+    """Return (operation, (bytes, blocks)) rows for boards of size `n`"""
+    state = NQueensState.random(n)
+    rng = random.Random(n)
+    return [
+        ("random", measure(lambda _: NQueensState.random(n), count // 10)),
+        ("copy", measure(lambda _: state.copy(), count)),
+        ("move", measure(lambda _: state.move(*state.random_move(rng)), count)),
+        ("apply", measure_applies(state, count)),
+    ]
+
+
+def run(sizes=(8, 100, 1000), count=2000):
+    """Print per-state memory and allocation counts for NQueensState"""
+    random.seed(0)
+    print(f"{'n':>6} {'operation':<10} {'bytes/state':>12} {'blocks/state':>13}")
+    for n in sizes:
+        for name, (size, blocks) in measure_size(n, count):
+            print(f"{n:>6} {name:<10} {size:>12.1f} {blocks:>13.2f}")
+
+
+if __name__ == "__main__":
+    run()
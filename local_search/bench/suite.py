@@ -0,0 +1,191 @@
+import csv
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from ..games.n_queens import NQueensState
+from ..games.state import UnsupportedStateError
+from ..local_search_parser import LocalSearchParser
+
+FIELDS = (
+    "algorithm",
+    "n",
+    "seed",
+    "success",
+    "final_value",
+    "wall_time",
+    "steps",
+    "steps_per_second",
+    "evaluations",
+    "peak_memory",
+)
+
+
+def build(algorithm_name, n, seed, max_steps=1000, **kwargs):
+    """
+    The algorithm set up on a seeded random N-Queens board. Raises
+    `UnsupportedStateError` if it cannot search N-Queens states.
+    """
+    initial_state = NQueensState.random(n, random.Random(seed))
+    return LocalSearchParser().parse(
+        algorithm_name,
+        initial_state=initial_state,
+        max_steps=max_steps,
+        seed=seed,
+        **kwargs,
+    )
+
+
+def run_once(algorithm_name, n, seed, max_steps=1000, memory=True, **kwargs):
+    """
+    Solve one seeded N-Queens board and return a result record.
+    Timing comes from an untraced run; with `memory`, the run is repeated
+    under tracemalloc to record peak memory in bytes.
+    """
+    algorithm = build(algorithm_name, n, seed, max_steps, **kwargs)
+    start = time.perf_counter()
+    final_state = algorithm.search()
+    wall_time = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        traced = build(algorithm_name, n, seed, max_steps, **kwargs)
+        tracemalloc.start()
+        try:
+            traced.search()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    steps = getattr(algorithm, "current_step", None)
+    return {
+        "algorithm": algorithm_name,
+        "n": n,
+        "seed": seed,
+        "success": bool(final_state is not None and final_state.is_goal()),
+        "final_value": None if final_state is None else int(final_state.value),
+        "wall_time": wall_time,
+        "steps": steps,
+        "steps_per_second": steps / wall_time if steps and wall_time > 0 else None,
+        "evaluations": getattr(algorithm, "evaluations", None),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(algorithms=None, sizes=(8, 16, 32), seeds=5, log=print, **kwargs):
+    """
+    Run every algorithm over every board size with seeds 0 .. `seeds` - 1.
+    Defaults to every registered algorithm, without aliases. Algorithms
+    that cannot search N-Queens states are skipped before any run; errors
+    during a run propagate. Extra keyword arguments are passed to
+    `run_once`.
+    """
+    if algorithms is None:
+        algorithms = LocalSearchParser().get_available_algorithms(include_aliases=False)
+    build_kwargs = {k: v for k, v in kwargs.items() if k != "memory"}
+
+    runs = []
+    for algorithm_name in algorithms:
+        try:
+            build(algorithm_name, sizes[0], 0, **build_kwargs)
+        except UnsupportedStateError as e:
+            if log:
+                log(f"{algorithm_name}: skipped ({e})")
+            continue
+
+        for n in sizes:
+            for seed in range(seeds):
+                runs.append(run_once(algorithm_name, n, seed, **kwargs))
+            if log:
+                log(_format_row(summarize(runs, algorithm_name, n)))
+    return runs
+
+
+def summarize(runs, algorithm_name, n):
+    """Aggregate the runs of one algorithm on one board size"""
+    group = [r for r in runs if r["algorithm"] == algorithm_name and r["n"] == n]
+    rates = [r["steps_per_second"] for r in group if r["steps_per_second"]]
+    evaluations = [r["evaluations"] for r in group if r["evaluations"] is not None]
+    memory = [r["peak_memory"] for r in group if r["peak_memory"] is not None]
+    return {
+        "algorithm": algorithm_name,
+        "n": n,
+        "runs": len(group),
+        "success_rate": sum(r["success"] for r in group) / len(group),
+        "median_wall_time": statistics.median(r["wall_time"] for r in group),
+        "mean_steps_per_second": statistics.fmean(rates) if rates else None,
+        "mean_evaluations": statistics.fmean(evaluations) if evaluations else None,
+        "max_peak_memory": max(memory) if memory else None,
+    }
+
+
+def summaries(runs):
+    """Summaries for every (algorithm, n) pair, in run order"""
+    keys = dict.fromkeys((r["algorithm"], r["n"]) for r in runs)
+    return [summarize(runs, algorithm_name, n) for algorithm_name, n in keys]
+
+
+def _format_row(summary):
+    rate = summary["mean_steps_per_second"]
+    memory = summary["max_peak_memory"]
+    return (
+        f"{summary['algorithm']:<22} n={summary['n']:<5} "
+        f"success={summary['success_rate']:>4.0%} "
+        f"time={summary['median_wall_time'] * 1000:>9.2f}ms "
+        f"steps/s={'-' if rate is None else f'{rate:,.0f}':>11} "
+        f"peak={'-' if memory is None else f'{memory / 1024:,.1f}KB':>10}"
+    )
+
+
+def write_json(runs, path):
+    """Write runs and their summaries as JSON"""
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": runs,
+        "summary": summaries(runs),
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(runs, path):
+    """Write one CSV row per run"""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(runs)
+
+
+def compare(runs, baseline_path, threshold=0.1):
+    """
+    Compare summaries against a JSON report written by `write_json`.
+    Returns a list of regression messages: median wall time more than
+    `threshold` slower, or a lower success rate.
+    """
+    with open(baseline_path) as f:
+        baseline = {(s["algorithm"], s["n"]): s for s in json.load(f)["summary"]}
+
+    regressions = []
+    for summary in summaries(runs):
+        key = (summary["algorithm"], summary["n"])
+        if key not in baseline:
+            continue
+        before = baseline[key]
+        name = f"{key[0]} n={key[1]}"
+
+        if summary["success_rate"] < before["success_rate"]:
+            regressions.append(
+                f"{name}: success rate {before['success_rate']:.0%} -> "
+                f"{summary['success_rate']:.0%}"
+            )
+        old_time = before["median_wall_time"]
+        new_time = summary["median_wall_time"]
+        if old_time > 0 and new_time > old_time * (1 + threshold):
+            regressions.append(
+                f"{name}: median time {old_time * 1000:.2f}ms -> "
+                f"{new_time * 1000:.2f}ms (+{new_time / old_time - 1:.0%})"
+            )
+    return regressions
@@ -0,0 +1,72 @@
+import numpy as np
+
+
+class BufferedRandom:
+    """
+    Random source for search hot loops, backed by its own
+    `numpy.random.Generator`. Uniforms and log-uniforms are drawn in blocks
+    of `block_size` and handed out one at a time, so each draw costs a list
+    iteration instead of a generator call. Provides the `random()` and
+    `randrange(n)` subset of `random.Random` used by states, plus
+    `log_random()` for threshold acceptance tests.
+
+    `getstate()` captures the generator and the undrawn part of both
+    buffers, so a restored instance continues the exact same stream.
+    """
+
+    def __init__(self, seed=None, block_size=4096):
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._next_uniform = iter(()).__next__
+        self._next_log_uniform = iter(()).__next__
+
+    def _refill_uniform(self):
+        block = self.generator.random(self.block_size).tolist()
+        self._next_uniform = iter(block).__next__
+
+    def _refill_log_uniform(self):
+        with np.errstate(divide="ignore"):
+            block = np.log(self.generator.random(self.block_size)).tolist()
+        self._next_log_uniform = iter(block).__next__
+
+    def getstate(self):
+        """Return the generator state and the remaining buffered draws"""
+        uniforms = list(self._next_uniform.__self__)
+        log_uniforms = list(self._next_log_uniform.__self__)
+        self._next_uniform = iter(uniforms).__next__
+        self._next_log_uniform = iter(log_uniforms).__next__
+        return {
+            "bit_generator": self.generator.bit_generator.state,
+            "uniforms": uniforms,
+            "log_uniforms": log_uniforms,
+        }
+
+    def setstate(self, state):
+        """Restore a state returned by `getstate`"""
+        self.generator.bit_generator.state = state["bit_generator"]
+        self._next_uniform = iter(list(state["uniforms"])).__next__
+        self._next_log_uniform = iter(list(state["log_uniforms"])).__next__
+
+    def random(self):
+        """Uniform float in [0, 1)"""
+        try:
+            return self._next_uniform()
+        except StopIteration:
+            self._refill_uniform()
+            return self._next_uniform()
+
+    def log_random(self):
+        """Logarithm of a uniform float in [0, 1), i.e. a value <= 0"""
+        try:
+            return self._next_log_uniform()
+        except StopIteration:
+            self._refill_log_uniform()
+            return self._next_log_uniform()
+
+    def randrange(self, n):
+        """Uniform integer in [0, n)"""
+        try:
+            return int(self._next_uniform() * n)
+        except StopIteration:
+            self._refill_uniform()
+            return int(self._next_uniform() * n)
@@ -0,0 +1,3 @@
+from .state import MoveState, NeighborsAdapter, UnsupportedStateError, as_move_state
+
+__all__ = ["MoveState", "NeighborsAdapter", "UnsupportedStateError", "as_move_state"]
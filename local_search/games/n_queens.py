@@ -1,56 +1,405 @@
 import random
+from array import array
+import numpy as np
+from .state import MoveState
+from .zobrist import mix64, xor_keys
 from ..local_search import LocalSearch
 from ..local_search_parser import LocalSearchParser
 
 
-class NQueensState:
+def _typecode(n):
+    """Smallest unsigned array typecode that can hold rows and counts up to n"""
+    return "H" if n <= 0xFFFF else "I"
+
+
+def _as_numpy(buffer):
+    """Read an `array` buffer into NumPy as int64 without Python iteration"""
+    return np.frombuffer(buffer, dtype=buffer.typecode).astype(np.int64)
+
+
+def _from_numpy(values, n):
+    """Pack a NumPy vector into an `array` sized for an n-queens board"""
+    typecode = _typecode(n)
+    buffer = array(typecode)
+    buffer.frombytes(values.astype(buffer.typecode).tobytes())
+    return buffer
+
+
+def _batch_bincount(indices, k, size):
+    """Counts of flattened per-chain `indices` as a K x size array"""
+    return np.bincount(indices.ravel(), minlength=k * size).reshape(k, size)
+
+
+class NQueensState(MoveState):
     """
     Represents a state in the N-Queens problem.
-    board_config: A tuple where index is column and value is row.
+    board_config: An `array` where index is column and value is row.
+
+    Occupancy counters for rows, diagonals (col - row) and anti-diagonals
+    (col + row) are kept alongside the board so single-queen moves can be
+    scored in O(1) with `delta`. A move is a `(col, row)` pair.
+
+    Buffers are copy-on-write: `copy` shares them in O(1) and the first
+    `apply` on a shared state duplicates them once.
+
+    `zobrist` is a 64-bit hash of the board, built on first use and then
+    updated by `apply` with two XORs per move.
     """
 
-    def __init__(self, board_config):
-        self.board_config = board_config
-        self.value = self._calculate_value()
+    __slots__ = (
+        "_owners",
+        "_zobrist",
+        "anti_diag_counts",
+        "board_config",
+        "diag_counts",
+        "row_counts",
+        "value",
+    )
+
+    def __init__(self, board_config, _counters=None, _value=None):
+        if isinstance(board_config, array):
+            self.board_config = board_config
+        else:
+            self.board_config = array(_typecode(len(board_config)), board_config)
+        if _counters is None:
+            _counters = self._build_counters()
+        self.row_counts, self.diag_counts, self.anti_diag_counts = _counters
+        self.value = self._calculate_value() if _value is None else _value
+        self._owners = [1]
+        self._zobrist = None
 
     @classmethod
-    def random(cls, n):
-        """Create a random N-Queens state"""
-        board_config = tuple(random.randint(0, n - 1) for _ in range(n))
+    def random(cls, n, rng=None):
+        """Create a random N-Queens state, drawing from `rng` if given"""
+        rng = rng or random
+        board_config = array(_typecode(n), [rng.randrange(n) for _ in range(n)])
         return cls(board_config)
 
+    def random_like(self, rng=None):
+        """Create a random state on a board of the same size"""
+        return NQueensState.random(len(self.board_config), rng)
+
+    def _build_counters(self):
+        """Count queens on every row, diagonal and anti-diagonal"""
+        n = len(self.board_config)
+        config = _as_numpy(self.board_config)
+        cols = np.arange(n)
+        return (
+            _from_numpy(np.bincount(config, minlength=n), n),
+            _from_numpy(np.bincount(cols - config + n - 1, minlength=2 * n - 1), n),
+            _from_numpy(np.bincount(cols + config, minlength=2 * n - 1), n),
+        )
+
     def _calculate_value(self):
         """
         Calculates the number of attacking pairs of queens.
         A lower value (closer to 0) indicates a better state.
         The goal state has a value of 0.
+
+        Every line holding k queens contributes k * (k - 1) / 2 pairs, so the
+        count is O(n) over the occupancy counters.
         """
-        n = len(self.board_config)
         attacking_pairs = 0
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Same row
-                if self.board_config[i] == self.board_config[j]:
-                    attacking_pairs += 1
-                # Same diagonal
-                if abs(self.board_config[i] - self.board_config[j]) == abs(i - j):
-                    attacking_pairs += 1
+        for counts in (self.row_counts, self.diag_counts, self.anti_diag_counts):
+            k = _as_numpy(counts)
+            attacking_pairs += int((k * (k - 1) // 2).sum())
         return attacking_pairs
 
+    def _detach(self):
+        """Take private copies of buffers still shared with other states"""
+        owners = self._owners
+        if owners[0] > 1:
+            owners[0] -= 1
+            self.board_config = array(self.board_config.typecode, self.board_config)
+            self.row_counts = array(self.row_counts.typecode, self.row_counts)
+            self.diag_counts = array(self.diag_counts.typecode, self.diag_counts)
+            self.anti_diag_counts = array(
+                self.anti_diag_counts.typecode, self.anti_diag_counts
+            )
+            self._owners = [1]
+
     @property
-    def neighbors(self):
+    def zobrist(self):
+        """64-bit Zobrist hash of the board: XOR of the keys of occupied squares"""
+        if self._zobrist is None:
+            n = len(self.board_config)
+            squares = np.arange(n) * n + _as_numpy(self.board_config)
+            self._zobrist = xor_keys(squares)
+        return self._zobrist
+
+    def move_zobrist(self, move):
+        """Zobrist hash of the state reached by `move`, in O(1)"""
+        col, row = move
+        current_row = self.board_config[col]
+        if row == current_row:
+            return self.zobrist
+        n = len(self.board_config)
+        return self.zobrist ^ mix64(col * n + current_row) ^ mix64(col * n + row)
+
+    def undo_move(self, move):
+        """Returns the move that takes the state reached by `move` back here"""
+        return (move[0], self.board_config[move[0]])
+
+    def delta(self, col, row):
         """
-        Generates all neighboring states by moving one queen to a different row.
+        Returns the change in value caused by moving the queen in `col` to
+        `row`, in O(1) and without building the successor state.
         """
-        neighbors = []
+        current_row = self.board_config[col]
+        if row == current_row:
+            return 0
+
         n = len(self.board_config)
+        removed = (
+            self.row_counts[current_row]
+            + self.diag_counts[col - current_row + n - 1]
+            + self.anti_diag_counts[col + current_row]
+            - 3
+        )
+        added = (
+            self.row_counts[row]
+            + self.diag_counts[col - row + n - 1]
+            + self.anti_diag_counts[col + row]
+        )
+        return added - removed
+
+    def iter_moves(self):
+        """Yield every (col, row) move of one queen to a different row"""
+        board_config = self.board_config
+        n = len(board_config)
         for col in range(n):
+            current_row = board_config[col]
             for row in range(n):
-                if row != self.board_config[col]:
-                    new_config = list(self.board_config)
-                    new_config[col] = row
-                    neighbors.append(NQueensState(tuple(new_config)))
-        return neighbors
+                if row != current_row:
+                    yield (col, row)
+
+    def random_move(self, rng):
+        """Draw a uniform move over the n * (n - 1) neighbors in O(1)"""
+        n = len(self.board_config)
+        if n < 2:
+            return None
+        col = rng.randrange(n)
+        row = rng.randrange(n - 1)
+        if row >= self.board_config[col]:
+            row += 1
+        return (col, row)
+
+    def move_value(self, move):
+        return self.value + self.delta(*move)
+
+    def move_value_matrix(self):
+        """
+        Scores all n x n moves at once with NumPy broadcasting.
+        Entry [col, row] is the value after moving the queen in `col` to
+        `row`; the current position of each queen is not a move and holds
+        the int64 maximum.
+        """
+        n = len(self.board_config)
+        config = _as_numpy(self.board_config)
+        row_counts = _as_numpy(self.row_counts)
+        diag_counts = _as_numpy(self.diag_counts)
+        anti_diag_counts = _as_numpy(self.anti_diag_counts)
+
+        cols = np.arange(n)
+        removed = (
+            row_counts[config]
+            + diag_counts[cols - config + n - 1]
+            + anti_diag_counts[cols + config]
+            - 3
+        )
+        added = (
+            row_counts[None, :]
+            + diag_counts[cols[:, None] - cols[None, :] + n - 1]
+            + anti_diag_counts[cols[:, None] + cols[None, :]]
+        )
+
+        values = added - removed[:, None] + self.value
+        values[cols, config] = np.iinfo(np.int64).max
+        return values
+
+    def apply(self, move):
+        """Move one queen in place, patching counters and value in O(1)"""
+        col, row = move
+        current_row = self.board_config[col]
+        if row == current_row:
+            return
+
+        n = len(self.board_config)
+        self._detach()
+        if self._zobrist is not None:
+            self._zobrist ^= mix64(col * n + current_row) ^ mix64(col * n + row)
+        self.value += self.delta(col, row)
+        self.board_config[col] = row
+        self.row_counts[current_row] -= 1
+        self.diag_counts[col - current_row + n - 1] -= 1
+        self.anti_diag_counts[col + current_row] -= 1
+        self.row_counts[row] += 1
+        self.diag_counts[col - row + n - 1] += 1
+        self.anti_diag_counts[col + row] += 1
+
+    def conflicts(self, col):
+        """Returns the number of queens attacking the queen in `col`, in O(1)"""
+        row = self.board_config[col]
+        n = len(self.board_config)
+        return (
+            self.row_counts[row]
+            + self.diag_counts[col - row + n - 1]
+            + self.anti_diag_counts[col + row]
+            - 3
+        )
+
+    def conflicted(self):
+        """Returns the columns whose queen is attacked, scanned with NumPy"""
+        n = len(self.board_config)
+        config = _as_numpy(self.board_config)
+        cols = np.arange(n)
+        conflicts = (
+            _as_numpy(self.row_counts)[config]
+            + _as_numpy(self.diag_counts)[cols - config + n - 1]
+            + _as_numpy(self.anti_diag_counts)[cols + config]
+            - 3
+        )
+        return np.flatnonzero(conflicts).tolist()
+
+    def greedy_initialize(self, rng, max_tries=128):
+        """
+        Re-places every queen in place on a near conflict-free permutation.
+        Each column draws rows from the pool of unused rows and keeps the
+        first one whose diagonals are both free, giving up after `max_tries`
+        draws. Only a handful of queens are left attacked, even for n in the
+        millions.
+        """
+        n = len(self.board_config)
+        board_config = array(_typecode(n), [0]) * n
+        diag_free = bytearray(b"\x01") * (2 * n - 1)
+        anti_diag_free = bytearray(b"\x01") * (2 * n - 1)
+        pool = list(range(n))
+        uniform = rng.random
+
+        for col in range(n):
+            remaining = n - col
+            shift = col + n - 1
+            for _ in range(max_tries):
+                index = col + int(uniform() * remaining)
+                row = pool[index]
+                if diag_free[shift - row] and anti_diag_free[col + row]:
+                    break
+            pool[index] = pool[col]
+            board_config[col] = row
+            diag_free[shift - row] = 0
+            anti_diag_free[col + row] = 0
+
+        self.board_config = board_config
+        self.row_counts, self.diag_counts, self.anti_diag_counts = (
+            self._build_counters()
+        )
+        self.value = self._calculate_value()
+        self._owners = [1]
+        self._zobrist = None
+
+    def repair(self, col, rng, max_swaps=64, noise=0.2):
+        """
+        Moves the queen in `col` toward fewer conflicts and returns the
+        columns that changed.
+
+        Swaps keep the rows a permutation, so partners whose swap lands
+        both queens on free diagonals are found first with one NumPy pass
+        and up to `max_swaps` of them are checked exactly. Otherwise the
+        queen takes its min-conflict row, ties broken at random. If that is
+        worse, or only sideways and a `noise` coin flip says so, a random
+        swap lets the search walk out of the local minimum.
+        """
+        n = len(self.board_config)
+        board_config = self.board_config
+        value = self.value
+        row = board_config[col]
+
+        config = _as_numpy(board_config)
+        row_counts = _as_numpy(self.row_counts)
+        diag_counts = _as_numpy(self.diag_counts)
+        anti_diag_counts = _as_numpy(self.anti_diag_counts)
+        cols = np.arange(n)
+
+        free = (
+            (diag_counts[col - config + n - 1] == 0)
+            & (anti_diag_counts[col + config] == 0)
+            & (diag_counts[cols - row + n - 1] == 0)
+            & (anti_diag_counts[cols + row] == 0)
+        )
+        candidates = np.flatnonzero(free)
+        if len(candidates):
+            start = rng.randrange(len(candidates))
+            for i in range(min(max_swaps, len(candidates))):
+                other = int(candidates[(start + i) % len(candidates)])
+                other_row = board_config[other]
+                self.apply((col, other_row))
+                self.apply((other, row))
+                if self.value < value:
+                    return (col, other)
+                self.apply((other, other_row))
+                self.apply((col, row))
+
+        conflicts = (
+            row_counts + diag_counts[col - cols + n - 1] + anti_diag_counts[col + cols]
+        )
+        conflicts[row] = np.iinfo(np.int64).max
+        best_rows = np.flatnonzero(conflicts == conflicts.min())
+        best_row = int(best_rows[rng.randrange(len(best_rows))])
+        delta = self.delta(col, best_row)
+        if delta < 0 or (delta == 0 and rng.random() >= noise):
+            self.apply((col, best_row))
+            return (col,)
+
+        other = rng.randrange(n)
+        other_row = board_config[other]
+        self.apply((col, other_row))
+        self.apply((other, row))
+        return (col, other)
+
+    def batch(self, chains, rng, random_starts=False):
+        """
+        Returns an `NQueensBatch` of `chains` copies of this board, or of
+        independent random boards drawn from the NumPy Generator `rng`.
+        """
+        n = len(self.board_config)
+        if random_starts:
+            return NQueensBatch(rng.integers(0, n, (chains, n)))
+        return NQueensBatch(np.tile(_as_numpy(self.board_config), (chains, 1)))
+
+    def to_config(self):
+        """Returns the board config array, for checkpoints"""
+        return self.board_config
+
+    @classmethod
+    def from_config(cls, config):
+        """Rebuild a state from a config array returned by `to_config`"""
+        return cls(array(_typecode(len(config)), config))
+
+    def copy(self):
+        """Return a copy sharing this state's buffers until either side moves"""
+        clone = object.__new__(type(self))
+        clone.board_config = self.board_config
+        clone.row_counts = self.row_counts
+        clone.diag_counts = self.diag_counts
+        clone.anti_diag_counts = self.anti_diag_counts
+        clone.value = self.value
+        clone._owners = self._owners
+        clone._zobrist = self._zobrist
+        self._owners[0] += 1
+        return clone
+
+    def move(self, col, row):
+        """Returns the state reached by moving the queen in `col` to `row`"""
+        moved = self.copy()
+        moved.apply((col, row))
+        return moved
+
+    @property
+    def neighbors(self):
+        """
+        Generates all neighboring states by moving one queen to a different row.
+        """
+        return [self.move(col, row) for col, row in self.iter_moves()]
 
     def is_goal(self):
         """
@@ -58,9 +407,12 @@ class NQueensState:
         """
         return self.value == 0
 
-    def display(self):
-        """Display the N-Queens board"""
+    def display(self, max_size=64):
+        """Display the N-Queens board, or a summary if it is too large"""
         n = len(self.board_config)
+        if n > max_size:
+            print(f"  ({n}x{n} board with {self.value} conflicts, not drawn)")
+            return
         board = [["." for _ in range(n)] for _ in range(n)]
 
         for col, row in enumerate(self.board_config):
@@ -70,23 +422,114 @@ class NQueensState:
             print("  " + " ".join(row))
 
     def __str__(self):
-        return f"NQueens({self.board_config}, conflicts={self.value})"
+        return f"NQueens({tuple(self.board_config)}, conflicts={self.value})"
 
     def __repr__(self):
         return self.__str__()
 
 
+class NQueensBatch:
+    """
+    K N-Queens boards advanced in lockstep with NumPy.
+    configs: A K x n array where row k is the board config of chain k.
+    Occupancy counters are K x n (rows) and K x (2n - 1) (diagonals), so a
+    move per chain is proposed, scored and applied with a few array ops.
+    """
+
+    def __init__(self, configs):
+        self.configs = np.array(configs, dtype=np.int64)
+        k, n = self.configs.shape
+        self.n = n
+        chains = np.arange(k)[:, None]
+        cols = np.arange(n)[None, :]
+        self.row_counts = _batch_bincount(chains * n + self.configs, k, n)
+        self.diag_counts = _batch_bincount(
+            chains * (2 * n - 1) + cols - self.configs + n - 1, k, 2 * n - 1
+        )
+        self.anti_diag_counts = _batch_bincount(
+            chains * (2 * n - 1) + cols + self.configs, k, 2 * n - 1
+        )
+        self.values = sum(
+            (counts * (counts - 1) // 2).sum(axis=1)
+            for counts in (self.row_counts, self.diag_counts, self.anti_diag_counts)
+        )
+
+    def __len__(self):
+        return len(self.configs)
+
+    def is_goal(self):
+        """Returns a boolean mask of chains with no attacking pairs"""
+        return self.values == 0
+
+    def propose(self, chains, rng):
+        """
+        Draws one uniform random move per chain in `chains` with the NumPy
+        Generator `rng`. Returns (cols, rows, deltas).
+        """
+        n = self.n
+        cols = rng.integers(0, n, len(chains))
+        rows = rng.integers(0, n - 1, len(chains))
+        rows += rows >= self.configs[chains, cols]
+        return cols, rows, self.deltas(chains, cols, rows)
+
+    def deltas(self, chains, cols, rows):
+        """Value change of moving queen `cols[i]` of chain `chains[i]` to `rows[i]`"""
+        n = self.n
+        current = self.configs[chains, cols]
+        removed = (
+            self.row_counts[chains, current]
+            + self.diag_counts[chains, cols - current + n - 1]
+            + self.anti_diag_counts[chains, cols + current]
+            - 3
+        )
+        added = (
+            self.row_counts[chains, rows]
+            + self.diag_counts[chains, cols - rows + n - 1]
+            + self.anti_diag_counts[chains, cols + rows]
+        )
+        return added - removed
+
+    def apply(self, chains, cols, rows, deltas):
+        """Commit one move per chain; each chain may appear at most once"""
+        n = self.n
+        current = self.configs[chains, cols]
+        self.row_counts[chains, current] -= 1
+        self.diag_counts[chains, cols - current + n - 1] -= 1
+        self.anti_diag_counts[chains, cols + current] -= 1
+        self.row_counts[chains, rows] += 1
+        self.diag_counts[chains, cols - rows + n - 1] += 1
+        self.anti_diag_counts[chains, cols + rows] += 1
+        self.configs[chains, cols] = rows
+        self.values[chains] += deltas
+
+    def state(self, chain):
+        """Returns chain `chain` as an NQueensState"""
+        return NQueensState(_from_numpy(self.configs[chain], self.n))
+
+
 def solve_n_queens(
-    n=8, algorithm_name="hill_climb", max_steps=1000, verbose=True, **kwargs
+    n=8,
+    algorithm_name="hill_climb",
+    max_steps=1000,
+    verbose=True,
+    seed=None,
+    **kwargs,
 ):
-    """Solve N-Queens using specified algorithm"""
+    """
+    Solve N-Queens using specified algorithm.
+    A `seed` makes the initial board and the search reproducible.
+    """
     if verbose:
         print(f"Solving {n}-Queens with {algorithm_name}")
         print("=" * 40)
 
-    initial_state = NQueensState.random(n)
+    initial_state = NQueensState.random(n, random.Random(seed))
     search = LocalSearch(
-        initial_state, algorithm_name=algorithm_name, max_steps=max_steps, **kwargs
+        initial_state,
+        algorithm_name=algorithm_name,
+        max_steps=max_steps,
+        seed=seed,
+        **kwargs,
     )
 
     if verbose:
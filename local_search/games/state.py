@@ -0,0 +1,123 @@
+from abc import ABC, abstractmethod
+
+
+class UnsupportedStateError(TypeError):
+    """Raised by an algorithm given a state that lacks the hooks it needs"""
+
+
+class MoveState(ABC):
+    """
+    Move-based state interface for local search.
+
+    A move is an opaque, state-defined value. Algorithms stream moves with
+    `iter_moves`, sample one with `random_move`, score it with `move_value`
+    and commit it with `apply`, so the neighborhood never has to be built.
+    `apply` mutates the state in place; use `copy` to keep a snapshot.
+
+    States whose moves are index tuples may also provide
+    `move_value_matrix()`: an array of every move value indexed by move,
+    with non-moves set to the dtype maximum. Steepest-ascent hill climbing
+    then scores the whole neighborhood in one vectorized call.
+
+    States may also provide `random_like(rng)`, returning a fresh random
+    state of the same problem instance, so random restarts explore new
+    starting points.
+
+    States that can be hashed incrementally may provide a 64-bit `zobrist`
+    hash and `move_zobrist(move)`, the hash after `move`, plus
+    `undo_move(move)`, the move that reverts `move`. Tabu search uses
+    these for its tabu list and its memory of visited states.
+
+    States that can be checkpointed provide `to_config()`, returning an
+    `array.array` that describes them, and `from_config(config)`, which
+    rebuilds the state from it. It is called on an existing state, so it
+    may be an instance method when states share problem data.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def iter_moves(self):
+        """Yield every move available from this state"""
+
+    @abstractmethod
+    def random_move(self, rng):
+        """Return a uniformly random move drawn with `rng`, or None if there is none"""
+
+    @abstractmethod
+    def move_value(self, move) -> int:
+        """Return the value of the state reached by `move`"""
+
+    @abstractmethod
+    def apply(self, move):
+        """Apply `move` to this state in place"""
+
+    @abstractmethod
+    def copy(self):
+        """Return an independent copy of this state"""
+
+    @abstractmethod
+    def is_goal(self) -> bool:
+        pass
+
+
+class NeighborsAdapter(MoveState):
+    """
+    Exposes the move protocol for states that only provide `neighbors`.
+    Moves are the neighbor states themselves; the neighbor list is built
+    lazily, once per visited state.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self._neighbors = None
+
+    @property
+    def value(self):
+        return self.state.value
+
+    @property
+    def neighbors(self):
+        if self._neighbors is None:
+            self._neighbors = self.state.neighbors
+        return self._neighbors
+
+    def iter_moves(self):
+        return iter(self.neighbors)
+
+    def random_move(self, rng):
+        neighbors = self.neighbors
+        if not neighbors:
+            return None
+        return neighbors[rng.randrange(len(neighbors))]
+
+    def move_value(self, move):
+        return move.value
+
+    def apply(self, move):
+        self.state = move
+        self._neighbors = None
+
+    def copy(self):
+        return NeighborsAdapter(self.state)
+
+    def is_goal(self):
+        return self.state.is_goal()
+
+    def __getattr__(self, name):
+        if name == "state":
+            raise AttributeError(name)
+        return getattr(self.state, name)
+
+    def __str__(self):
+        return str(self.state)
+
+    def __repr__(self):
+        return repr(self.state)
+
+
+def as_move_state(state):
+    """Return `state` if it implements the move protocol, else wrap it"""
+    if isinstance(state, MoveState):
+        return state
+    return NeighborsAdapter(state)
@@ -0,0 +1,873 @@
+import math
+import random
+from array import array
+import numpy as np
+from .state import MoveState
+from .zobrist import mix64, xor_keys
+from ..local_search import LocalSearch
+from ..local_search_parser import LocalSearchParser
+
+EDGE_WEIGHT_TYPES = ("EUC_2D", "CEIL_2D", "ATT", "GEO")
+
+# Paths up to this many cities are reversed in Python, longer ones with NumPy
+_SHORT_PATH = 32
+
+# Draws `random_move` makes before giving up on finding a valid move
+_RANDOM_TRIES = 16
+
+_GEO_PI = 3.141592
+_GEO_RADIUS = 6378.388
+
+
+def _geo_radians(values):
+    """TSPLIB GEO coordinates (degrees.minutes) as radians"""
+    degrees = np.trunc(values)
+    return _GEO_PI * (degrees + 5.0 * (values - degrees) / 3.0) / 180.0
+
+
+# Padded grid slots per city above which `nearest_neighbors` stops padding
+_MAX_PADDING = 16
+
+# Candidate distances `nearest_neighbors` computes per vectorized batch
+_BATCH_ENTRIES = 1 << 20
+
+
+def nearest_neighbors(coords, k):
+    """
+    Returns the `k` nearest other cities of every city as an n x k int32
+    array, closest first.
+
+    Cities are bucketed on a uniform grid of about k per cell, and each
+    city is first matched against the 3 x 3 cells around it in vectorized
+    batches. Cities whose k-th nearest distance is not covered by that
+    block, and every city when some cell is too crowded to pad, fall back
+    to a square ring of cells that grows until it covers it. Time is linear
+    in n on reasonably spread instances, and no n x n distance matrix is
+    ever built.
+    """
+    coords = np.asarray(coords, dtype=float)
+    n = len(coords)
+    k = max(0, min(k, n - 1))
+    neighbors = np.empty((n, k), dtype=np.int32)
+    if k == 0:
+        return neighbors
+
+    x, y = coords[:, 0], coords[:, 1]
+    low = coords.min(axis=0)
+    span = float((coords.max(axis=0) - low).max()) or 1.0
+    side = max(1, int(math.sqrt(n / k)))
+    cell = span / side
+    grid = np.minimum(((coords - low) / cell).astype(np.int64), side - 1)
+    cell_ids = grid[:, 0] * side + grid[:, 1]
+    order = np.argsort(cell_ids, kind="stable")
+    bounds = np.searchsorted(cell_ids[order], np.arange(side * side + 1))
+
+    def nearest(members, candidates):
+        squared = (x[candidates] - x[members, None]) ** 2
+        squared += (y[candidates] - y[members, None]) ** 2
+        squared[members[:, None] == candidates] = np.inf
+        closest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+        closest_squared = np.take_along_axis(squared, closest, axis=1)
+        ranked = np.argsort(closest_squared, axis=1, kind="stable")
+        closest = np.take_along_axis(closest, ranked, axis=1)
+        return closest, np.take_along_axis(closest_squared, ranked, axis=1)
+
+    def ring_search(members, cx, cy, radius):
+        while True:
+            x0, x1 = max(0, cx - radius), min(side - 1, cx + radius)
+            y0, y1 = max(0, cy - radius), min(side - 1, cy + radius)
+            candidates = np.concatenate(
+                [
+                    order[bounds[x * side + y0] : bounds[x * side + y1 + 1]]
+                    for x in range(x0, x1 + 1)
+                ]
+            )
+            whole_grid = x0 == 0 and y0 == 0 and x1 == side - 1 and y1 == side - 1
+            if len(candidates) > k:
+                closest, closest_squared = nearest(members, candidates)
+                if whole_grid or closest_squared[:, -1].max() <= (radius * cell) ** 2:
+                    neighbors[members] = candidates[closest]
+                    return
+            radius += 1
+
+    counts = np.diff(bounds)
+    width = int(counts.max())
+    if width * side * side > _MAX_PADDING * n:
+        for cell_id in np.flatnonzero(counts).tolist():
+            members = order[bounds[cell_id] : bounds[cell_id + 1]]
+            ring_search(members, *divmod(cell_id, side), 1)
+        return neighbors
+
+    # Cell contents padded to `width` with -1, and a border of empty cells
+    slots = np.full((side + 2, side + 2, width), -1, dtype=np.int64)
+    ranks = np.arange(n) - bounds[cell_ids[order]]
+    slots[grid[order, 0] + 1, grid[order, 1] + 1, ranks] = order
+    shifts = np.array([(dx, dy) for dx in (0, 1, 2) for dy in (0, 1, 2)])
+
+    uncovered = []
+    batch = max(1, _BATCH_ENTRIES // (9 * width))
+    for start in range(0, n, batch):
+        members = np.arange(start, min(n, start + batch))
+        candidates = slots[
+            grid[members, 0, None] + shifts[:, 0], grid[members, 1, None] + shifts[:, 1]
+        ].reshape(len(members), -1)
+        padding = candidates < 0
+        squared = (x[candidates] - x[members, None]) ** 2
+        squared += (y[candidates] - y[members, None]) ** 2
+        squared[padding | (members[:, None] == candidates)] = np.inf
+        closest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+        closest_squared = np.take_along_axis(squared, closest, axis=1)
+        ranked = np.argsort(closest_squared, axis=1, kind="stable")
+        closest = np.take_along_axis(closest, ranked, axis=1)
+        covered = np.take_along_axis(closest_squared, ranked, axis=1)[:, -1] <= cell**2
+        chosen = np.take_along_axis(candidates, closest, axis=1)
+        neighbors[members[covered]] = chosen[covered]
+        uncovered.append(members[~covered])
+
+    uncovered = np.concatenate(uncovered)
+    uncovered = uncovered[np.argsort(cell_ids[uncovered], kind="stable")]
+    cells, starts = np.unique(cell_ids[uncovered], return_index=True)
+    for cell_id, members in zip(cells.tolist(), np.split(uncovered, starts[1:])):
+        ring_search(members, *divmod(cell_id, side), 2)
+    return neighbors
+
+
+def _hilbert_order(coords, bits=16):
+    """Indices of `coords` sorted along a Hilbert curve over their bounding box"""
+    coords = np.asarray(coords, dtype=float)
+    side = 1 << bits
+    low = coords.min(axis=0)
+    span = float((coords.max(axis=0) - low).max()) or 1.0
+    grid = np.minimum(((coords - low) / span * side).astype(np.int64), side - 1)
+    x, y = grid[:, 0], grid[:, 1]
+    index = np.zeros(len(coords), dtype=np.int64)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        index += s * s * ((3 * rx) ^ ry)
+        flip = rx & ~ry
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return np.argsort(index, kind="stable")
+
+
+class TSPInstance:
+    """
+    A symmetric traveling-salesman instance.
+    coords: An n x 2 array of city coordinates, read as x/y or, for GEO,
+    latitude/longitude.
+
+    Distances follow the TSPLIB `edge_weight_type` and are computed from
+    the coordinates on demand, so memory stays O(n k) for the `neighbors`
+    candidate lists (see `nearest_neighbors`) rather than O(n^2). The
+    instance is read-only and shared by every tour built on it.
+    """
+
+    def __init__(self, coords, edge_weight_type="EUC_2D", name=None, neighbors=10):
+        if edge_weight_type not in EDGE_WEIGHT_TYPES:
+            raise ValueError(
+                f"Unsupported EDGE_WEIGHT_TYPE '{edge_weight_type}'. "
+                f"Supported: {', '.join(EDGE_WEIGHT_TYPES)}"
+            )
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        self.n = len(self.coords)
+        self.edge_weight_type = edge_weight_type
+        self.name = name
+        self.neighbors = nearest_neighbors(self.coords, neighbors)
+        self._bind()
+
+    @classmethod
+    def random(cls, n, rng=None, size=None, **kwargs):
+        """
+        Create an instance of `n` cities drawn uniformly from a square,
+        drawing from `rng` if given. The side defaults to 1000 * sqrt(n), so
+        typical edges stay around a thousand units long.
+        """
+        rng = rng or random
+        size = size or 1000 * math.sqrt(n)
+        coords = [(rng.random() * size, rng.random() * size) for _ in range(n)]
+        return cls(coords, name=f"random{n}", **kwargs)
+
+    def _bind(self):
+        """Build the per-type scalar `distance` function and its lookup tables"""
+        kind = self.edge_weight_type
+        self._flat_neighbors = array("i", self.neighbors.astype(np.intc).tobytes())
+        self._geo = None
+        if kind == "GEO":
+            self._geo = _geo_radians(self.coords)
+            latitude = self._geo[:, 0].tolist()
+            longitude = self._geo[:, 1].tolist()
+            cos, acos = math.cos, math.acos
+
+            def distance(a, b):
+                q1 = cos(longitude[a] - longitude[b])
+                q2 = cos(latitude[a] - latitude[b])
+                q3 = cos(latitude[a] + latitude[b])
+                angle = acos(min(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))
+                return int(_GEO_RADIUS * angle + 1.0)
+
+            self.distance = distance
+            return
+
+        x = self.coords[:, 0].tolist()
+        y = self.coords[:, 1].tolist()
+        hypot, sqrt, ceil = math.hypot, math.sqrt, math.ceil
+        if kind == "EUC_2D":
+
+            def distance(a, b):
+                return int(hypot(x[a] - x[b], y[a] - y[b]) + 0.5)
+
+        elif kind == "CEIL_2D":
+
+            def distance(a, b):
+                return ceil(hypot(x[a] - x[b], y[a] - y[b]))
+
+        else:
+
+            def distance(a, b):
+                dx = x[a] - x[b]
+                dy = y[a] - y[b]
+                r = sqrt((dx * dx + dy * dy) / 10.0)
+                t = int(r + 0.5)
+                return t + 1 if t < r else t
+
+        self.distance = distance
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ("distance", "_flat_neighbors", "_geo"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._bind()
+
+    def distances(self, a, b):
+        """`distance` between NumPy vectors of cities `a` and `b`, as int64"""
+        if self._geo is not None:
+            latitude, longitude = self._geo[:, 0], self._geo[:, 1]
+            q1 = np.cos(longitude[a] - longitude[b])
+            q2 = np.cos(latitude[a] - latitude[b])
+            q3 = np.cos(latitude[a] + latitude[b])
+            cosine = np.minimum(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3))
+            return (_GEO_RADIUS * np.arccos(cosine) + 1.0).astype(np.int64)
+
+        dx = self.coords[a, 0] - self.coords[b, 0]
+        dy = self.coords[a, 1] - self.coords[b, 1]
+        if self.edge_weight_type == "EUC_2D":
+            return np.floor(np.hypot(dx, dy) + 0.5).astype(np.int64)
+        if self.edge_weight_type == "CEIL_2D":
+            return np.ceil(np.hypot(dx, dy)).astype(np.int64)
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = np.floor(r + 0.5)
+        return (t + (t < r)).astype(np.int64)
+
+    def tour_length(self, tour):
+        """Length of the closed tour visiting the cities of `tour` in order"""
+        cities = np.asarray(tour, dtype=np.int64)
+        return int(self.distances(cities, np.roll(cities, -1)).sum())
+
+    def __str__(self):
+        return f"TSPInstance({self.name}, n={self.n}, {self.edge_weight_type})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def read_tsplib(path, neighbors=10):
+    """
+    Load a TSPLIB file of TYPE TSP with a NODE_COORD_SECTION.
+    EUC_2D, CEIL_2D, ATT and GEO distances are supported; explicit weight
+    matrices are not, as they would not scale to large instances.
+    """
+    header = {}
+    coords = []
+    with open(path) as f:
+        lines = iter(f)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("NODE_COORD_SECTION"):
+                for line in lines:
+                    fields = line.split()
+                    if not fields:
+                        continue
+                    if fields[0] == "EOF" or not fields[0].isdigit():
+                        break
+                    coords.append((float(fields[1]), float(fields[2])))
+                break
+            if line == "EOF":
+                break
+            key, _, value = line.partition(":")
+            header[key.strip().upper()] = value.strip()
+
+    problem_type = header.get("TYPE", "TSP").split()[0]
+    if problem_type != "TSP":
+        raise ValueError(f"{path}: unsupported TYPE '{problem_type}'")
+    if not coords:
+        raise ValueError(f"{path}: no NODE_COORD_SECTION found")
+    dimension = int(header.get("DIMENSION", len(coords)))
+    if dimension != len(coords):
+        raise ValueError(
+            f"{path}: DIMENSION is {dimension} but {len(coords)} cities were read"
+        )
+    return TSPInstance(
+        coords,
+        header.get("EDGE_WEIGHT_TYPE", "EUC_2D"),
+        name=header.get("NAME"),
+        neighbors=neighbors,
+    )
+
+
+class TSPState(MoveState):
+    """
+    Represents a tour of a `TSPInstance`.
+    tour: An `array` of the cities in visiting order; `pos` maps every city
+    back to its index in `tour`. The value is the tour length.
+
+    A move `(a, j, kind)` adds the edge from city `a` to its j-th nearest
+    neighbor c, so the neighborhood is pruned to O(n k) moves by the
+    instance's candidate lists. Kinds 0 and 1 are the two 2-opt moves that
+    create (a, c): one replaces (a, succ a) and (c, succ c) with (a, c) and
+    (succ a, succ c), the other does the same from pred a and pred c.
+    Kinds 2L and 2L + 1 are Or-opt moves of the L cities starting at `a`,
+    for L up to `or_opt`: inserted between c and succ c, or reversed
+    between pred c and c. Moves name cities rather than positions, so they
+    stay meaningful as the tour changes, and every move is scored in O(1)
+    from the edges it removes and adds.
+
+    `move_value_matrix` scores the whole neighborhood as an n x k x kinds
+    array with NumPy, so hill climbing and tabu search stay vectorized.
+
+    With `dont_look_bits`, a city whose moves were all scanned without an
+    improvement is left out of `iter_moves` and `move_value_matrix` until a
+    move changes one of its edges, so descent algorithms only rescan the
+    part of the tour that changed. `random_move` ignores the bits.
+
+    Applying a move reverses the shorter side of the tour. Buffers are
+    copy-on-write as in `NQueensState`. `zobrist` hashes the set of edges,
+    so it does not depend on the direction or starting city of the tour.
+    A `target` length, when given, makes any tour at most that long a goal.
+    """
+
+    __slots__ = (
+        "_active",
+        "_owners",
+        "_zobrist",
+        "instance",
+        "or_opt",
+        "pos",
+        "target",
+        "tour",
+        "value",
+    )
+
+    def __init__(
+        self,
+        instance,
+        tour,
+        dont_look_bits=False,
+        or_opt=3,
+        target=None,
+        _value=None,
+    ):
+        if not isinstance(tour, array) or tour.typecode != "i":
+            tour = array("i", tour)
+        n = instance.n
+        if len(tour) != n:
+            raise ValueError(f"Tour visits {len(tour)} cities, instance has {n}")
+        self.instance = instance
+        self.tour = tour
+        self.pos = array("i", bytes(tour.itemsize * n))
+        np.frombuffer(self.pos, dtype=np.intc)[np.frombuffer(tour, dtype=np.intc)] = (
+            np.arange(n, dtype=np.intc)
+        )
+        self.value = instance.tour_length(tour) if _value is None else _value
+        self.or_opt = or_opt
+        self.target = target
+        self._active = dict.fromkeys(range(n)) if dont_look_bits else None
+        self._owners = [1]
+        self._zobrist = None
+
+    @classmethod
+    def random(cls, instance, rng=None, **kwargs):
+        """Create a uniformly random tour, drawing from `rng` if given"""
+        rng = rng or random
+        tour = list(range(instance.n))
+        for i in range(len(tour) - 1, 0, -1):
+            j = rng.randrange(i + 1)
+            tour[i], tour[j] = tour[j], tour[i]
+        return cls(instance, tour, **kwargs)
+
+    @classmethod
+    def space_filling(cls, instance, **kwargs):
+        """
+        Create a tour visiting the cities along a Hilbert curve, in
+        O(n log n). It is typically within 25% of optimal on uniform
+        instances, a far better start than a random tour for large n.
+        """
+        return cls(instance, _hilbert_order(instance.coords).tolist(), **kwargs)
+
+    def random_like(self, rng=None):
+        """Create a random tour of the same instance with the same settings"""
+        return TSPState.random(
+            self.instance,
+            rng,
+            dont_look_bits=self._active is not None,
+            or_opt=self.or_opt,
+            target=self.target,
+        )
+
+    @property
+    def kinds(self):
+        """Number of move kinds per candidate edge"""
+        return 2 + 2 * self.or_opt
+
+    def _detach(self):
+        """Take private copies of buffers still shared with other states"""
+        owners = self._owners
+        if owners[0] > 1:
+            owners[0] -= 1
+            self.tour = array("i", self.tour)
+            self.pos = array("i", self.pos)
+            self._owners = [1]
+
+    def succ(self, city):
+        """The city visited after `city`"""
+        return self.tour[(self.pos[city] + 1) % len(self.tour)]
+
+    def pred(self, city):
+        """The city visited before `city`"""
+        return self.tour[self.pos[city] - 1]
+
+    def _edge_key(self, a, b):
+        if a > b:
+            a, b = b, a
+        return mix64(a * len(self.tour) + b)
+
+    @property
+    def zobrist(self):
+        """64-bit Zobrist hash of the tour: XOR of the keys of its edges"""
+        if self._zobrist is None:
+            n = len(self.tour)
+            cities = np.frombuffer(self.tour, dtype=np.intc).astype(np.int64)
+            following = np.roll(cities, -1)
+            edges = np.minimum(cities, following) * n + np.maximum(cities, following)
+            self._zobrist = xor_keys(edges)
+        return self._zobrist
+
+    def move_zobrist(self, move):
+        """Zobrist hash of the tour reached by `move`, in O(1)"""
+        zobrist = self.zobrist
+        removed, added = self._move_edges(move)
+        for a, b in removed + added:
+            zobrist ^= self._edge_key(a, b)
+        return zobrist
+
+    def _or_opt_cities(self, a, length, t):
+        """
+        The cities (p, s, e, q, t, nt) of an Or-opt move of the `length`
+        cities s .. e starting at `a` between t and succ t, where p and q
+        are the cities around the segment.
+        """
+        tour, pos = self.tour, self.pos
+        n = len(tour)
+        i = pos[a]
+        return (
+            tour[i - 1],
+            a,
+            tour[(i + length - 1) % n],
+            tour[(i + length) % n],
+            t,
+            tour[(pos[t] + 1) % n],
+        )
+
+    def _move_edges(self, move):
+        """Returns the edges `move` removes and the edges it adds"""
+        a, j, kind = move
+        c = self.instance._flat_neighbors[a * self.instance.neighbors.shape[1] + j]
+        if kind < 2:
+            if kind == 1:
+                a, c = self.pred(a), self.pred(c)
+            b = self.succ(a)
+            d = self.succ(c)
+            return ((a, b), (c, d)), ((a, c), (b, d))
+
+        if kind % 2:
+            p, s, e, q, t, nt = self._or_opt_cities(a, kind // 2, self.pred(c))
+            return ((p, s), (e, q), (t, nt)), ((p, q), (t, e), (s, nt))
+        p, s, e, q, t, nt = self._or_opt_cities(a, kind // 2, c)
+        return ((p, s), (e, q), (t, nt)), ((p, q), (t, s), (e, nt))
+
+    def is_valid(self, move):
+        """True if `move` changes the tour"""
+        a, j, kind = move
+        tour, pos = self.tour, self.pos
+        n = len(tour)
+        c = self.instance._flat_neighbors[a * self.instance.neighbors.shape[1] + j]
+        if kind < 2:
+            if kind == 1:
+                a, c = tour[pos[a] - 1], tour[pos[c] - 1]
+            return (
+                a != c and tour[(pos[a] + 1) % n] != c and tour[(pos[c] + 1) % n] != a
+            )
+
+        length = kind // 2
+        if length + 3 > n:
+            return False
+        t = tour[pos[c] - 1] if kind % 2 else c
+        i = pos[a]
+        return (pos[t] - i) % n >= length and t != tour[i - 1] and t != tour[i - 2]
+
+    def delta(self, move):
+        """
+        Returns the change in tour length caused by `move`, in O(1) and
+        without building the successor tour.
+        """
+        distance = self.instance.distance
+        removed, added = self._move_edges(move)
+        change = 0
+        for a, b in added:
+            change += distance(a, b)
+        for a, b in removed:
+            change -= distance(a, b)
+        return change
+
+    def _city_moves(self, a):
+        """Yield the valid moves that add an edge at city `a`"""
+        k = self.instance.neighbors.shape[1]
+        kinds = self.kinds
+        for j in range(k):
+            for kind in range(kinds):
+                move = (a, j, kind)
+                if self.is_valid(move):
+                    yield move
+
+    def iter_moves(self):
+        """
+        Yield the moves of every city, or with don't-look bits of the active
+        cities only. A city whose moves were all yielded without an
+        improving one among them is switched off.
+        """
+        active = self._active
+        if active is None:
+            for a in range(len(self.tour)):
+                yield from self._city_moves(a)
+            return
+
+        for a in list(active):
+            improving = False
+            for move in self._city_moves(a):
+                if not improving and self.delta(move) < 0:
+                    improving = True
+                yield move
+            if not improving:
+                active.pop(a, None)
+
+    def random_move(self, rng):
+        """
+        Draw a random move: a random city, neighbor slot and kind. Returns
+        None if no valid move was drawn after a few tries.
+        """
+        n = len(self.tour)
+        k = self.instance.neighbors.shape[1]
+        if n < 4 or k == 0:
+            return None
+        kinds = self.kinds
+        for _ in range(_RANDOM_TRIES):
+            move = (rng.randrange(n), rng.randrange(k), rng.randrange(kinds))
+            if self.is_valid(move):
+                return move
+        return None
+
+    def move_value(self, move):
+        return self.value + self.delta(move)
+
+    def move_value_matrix(self):
+        """
+        Scores all moves at once with NumPy. Entry [a, j, kind] is the tour
+        length after move (a, j, kind); invalid moves, and with don't-look
+        bits the moves of inactive cities, hold the int64 maximum. Active
+        cities without an improving move are switched off.
+        """
+        n = len(self.tour)
+        neighbors = self.instance.neighbors
+        k = neighbors.shape[1]
+        values = np.full((n, k, self.kinds), np.iinfo(np.int64).max, dtype=np.int64)
+        active = self._active
+        if active is None:
+            cities = np.arange(n)
+        else:
+            cities = np.fromiter(active, dtype=np.int64, count=len(active))
+        if n < 4 or k == 0 or len(cities) == 0:
+            return values
+
+        distances = self.instance.distances
+        tour = np.frombuffer(self.tour, dtype=np.intc).astype(np.int64)
+        pos = np.frombuffer(self.pos, dtype=np.intc).astype(np.int64)
+        succ = np.roll(tour, -1)[pos]
+        pred = np.roll(tour, 1)[pos]
+
+        a = np.repeat(cities[:, None], k, axis=1)
+        c = neighbors[cities].astype(np.int64)
+        rows = values[cities]
+
+        for kind, (x, y) in enumerate(((a, c), (pred[a], pred[c]))):
+            sx, sy = succ[x], succ[y]
+            delta = (
+                distances(x, y)
+                + distances(sx, sy)
+                - distances(x, sx)
+                - distances(y, sy)
+            )
+            valid = (x != y) & (sx != y) & (sy != x)
+            rows[:, :, kind] = np.where(valid, self.value + delta, rows[:, :, kind])
+
+        p = pred[a]
+        for length in range(1, self.or_opt + 1):
+            if length + 3 > n:
+                break
+            e = tour[(pos[a] + length - 1) % n]
+            q = succ[e]
+            removed = distances(p, q) - distances(p, a) - distances(e, q)
+            for flipped, t in ((0, c), (1, pred[c])):
+                nt = succ[t]
+                if flipped:
+                    joined = distances(t, e) + distances(a, nt)
+                else:
+                    joined = distances(t, a) + distances(e, nt)
+                delta = removed + joined - distances(t, nt)
+                valid = ((pos[t] - pos[a]) % n >= length) & (t != p) & (t != pred[p])
+                kind = 2 * length + flipped
+                rows[:, :, kind] = np.where(valid, self.value + delta, rows[:, :, kind])
+
+        values[cities] = rows
+        if active is not None:
+            stuck = rows.reshape(len(cities), -1).min(axis=1) >= self.value
+            for city in cities[stuck].tolist():
+                del active[city]
+        return values
+
+    def _reverse(self, first, last):
+        """
+        Reverse the path from city `first` forward to city `last`, or the
+        rest of the tour instead when that is shorter; both give the same
+        cycle.
+        """
+        tour, pos = self.tour, self.pos
+        n = len(tour)
+        i, j = pos[first], pos[last]
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+
+        if length <= _SHORT_PATH:
+            for _ in range(length // 2):
+                a, b = tour[i], tour[j]
+                tour[i] = b
+                pos[b] = i
+                tour[j] = a
+                pos[a] = j
+                i = i + 1 if i + 1 < n else 0
+                j = j - 1 if j > 0 else n - 1
+            return
+
+        cities = np.frombuffer(tour, dtype=np.intc)
+        positions = np.frombuffer(pos, dtype=np.intc)
+        if i <= j:
+            path = cities[i : j + 1][::-1].copy()
+            cities[i : j + 1] = path
+            positions[path] = np.arange(i, j + 1, dtype=np.intc)
+        else:
+            indices = np.arange(i, i + length) % n
+            path = cities[indices][::-1]
+            cities[indices] = path
+            positions[path] = indices
+
+    def _exchange(self, a, b, c, d):
+        """
+        Replace edges (a, b) and (c, d), both running in the same direction
+        of the tour, with (a, c) and (b, d).
+        """
+        if self.succ(a) == b:
+            self._reverse(b, c)
+        else:
+            self._reverse(c, b)
+
+    def apply(self, move):
+        """
+        Apply a 2-opt move as one exchange of two edges, or an Or-opt move
+        as two or three of them, updating length and hash in O(1).
+        """
+        removed, added = self._move_edges(move)
+        self._detach()
+        self.value += self.delta(move)
+        if self._zobrist is not None:
+            for a, b in removed + added:
+                self._zobrist ^= self._edge_key(a, b)
+
+        if move[2] < 2:
+            (a, b), (c, d) = removed
+            self._exchange(a, b, c, d)
+        else:
+            (p, s), (e, q), (t, nt) = removed
+            self._exchange(p, s, t, nt)
+            if t != q:
+                self._exchange(p, t, q, e)
+            if move[2] % 2 == 0:
+                self._exchange(t, e, s, nt)
+
+        active = self._active
+        if active is not None:
+            for a, b in removed:
+                active[a] = None
+                active[b] = None
+
+    def to_config(self):
+        """Returns the tour array, for checkpoints"""
+        return self.tour
+
+    def from_config(self, config):
+        """Rebuild a tour of this instance from an array returned by `to_config`"""
+        return TSPState(
+            self.instance,
+            array("i", config),
+            dont_look_bits=self._active is not None,
+            or_opt=self.or_opt,
+            target=self.target,
+        )
+
+    def copy(self):
+        """Return a copy sharing this tour's buffers until either side moves"""
+        clone = object.__new__(type(self))
+        clone.instance = self.instance
+        clone.tour = self.tour
+        clone.pos = self.pos
+        clone.value = self.value
+        clone.or_opt = self.or_opt
+        clone.target = self.target
+        clone._active = None if self._active is None else self._active.copy()
+        clone._owners = self._owners
+        clone._zobrist = self._zobrist
+        self._owners[0] += 1
+        return clone
+
+    def is_goal(self):
+        """
+        Returns True if the tour is no longer than `target`. Without a
+        target there is no goal and searches run until they stop improving.
+        """
+        return self.target is not None and self.value <= self.target
+
+    def display(self, max_cities=20):
+        """Display the tour, or its start if it is long"""
+        n = len(self.tour)
+        cities = " -> ".join(str(city) for city in self.tour[:max_cities])
+        if n > max_cities:
+            cities += f" -> ... ({n - max_cities} more)"
+        print(f"  {cities}")
+        print(f"  Length: {self.value}")
+
+    def __str__(self):
+        return f"TSP({self.instance.name}, n={len(self.tour)}, length={self.value})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def solve_tsp(
+    instance,
+    algorithm_name="first_choice",
+    max_steps=100000,
+    verbose=True,
+    seed=None,
+    start="space_filling",
+    dont_look_bits=False,
+    **kwargs,
+):
+    """
+    Improve a tour of `instance`, a `TSPInstance` or a TSPLIB file path,
+    using the specified algorithm. `start` is "space_filling" or "random";
+    a `seed` makes the random start and the search reproducible.
+    """
+    if not isinstance(instance, TSPInstance):
+        instance = read_tsplib(instance)
+
+    if start == "random":
+        initial_state = TSPState.random(
+            instance, random.Random(seed), dont_look_bits=dont_look_bits
+        )
+    else:
+        initial_state = TSPState.space_filling(instance, dont_look_bits=dont_look_bits)
+
+    if verbose:
+        print(f"Solving {instance} with {algorithm_name}")
+        print("=" * 40)
+
+    search = LocalSearch(
+        initial_state,
+        algorithm_name=algorithm_name,
+        max_steps=max_steps,
+        seed=seed,
+        **kwargs,
+    )
+
+    if verbose:
+        print(f"Algorithm: {search.get_algorithm_name()}")
+        print(f"Initial length: {initial_state.value}")
+        print(f"Max steps: {max_steps}")
+        print("Running search...")
+
+    final_state = search.search()
+
+    if verbose:
+        print(f"Final length: {final_state.value}")
+        print("Tour:")
+        final_state.display()
+
+    return final_state
+
+
+def main():
+    """Main function for command line execution"""
+    import sys
+
+    if len(sys.argv) < 2 or sys.argv[1] in ["--help", "-h"]:
+        parser = LocalSearchParser()
+        available = parser.get_available_algorithms()
+        print("TSP Local Search with Algorithm Parser")
+        print(
+            "Usage: uv run -m local_search.games.tsp <file.tsp | cities> "
+            "[algorithm] [max_steps]"
+        )
+        print(f"Available algorithms: {', '.join(available)}")
+        print("Examples:")
+        print("  uv run -m local_search.games.tsp berlin52.tsp first_choice")
+        print("  uv run -m local_search.games.tsp 1000 minimization_sa 200000")
+        sys.exit(0)
+
+    source = sys.argv[1]
+    algorithm_name = sys.argv[2] if len(sys.argv) > 2 else "first_choice"
+    max_steps = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+    if source.isdigit():
+        instance = TSPInstance.random(int(source), random.Random(0))
+    else:
+        instance = read_tsplib(source)
+
+    try:
+        solve_tsp(instance, algorithm_name, max_steps)
+    except (ValueError, TypeError) as e:
+        print(f"Error: {e}")
+        parser = LocalSearchParser()
+        available = parser.get_available_algorithms()
+        print(f"Available algorithms: {', '.join(available)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+
+
+def mix64(key):
+    """Zobrist key of a non-negative integer `key` (splitmix64, no table)"""
+    key = (key + 0x9E3779B97F4A7C15) & _MASK64
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return key ^ (key >> 31)
+
+
+def mix64_array(keys):
+    """`mix64` over a NumPy vector of keys"""
+    keys = keys.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    keys = (keys ^ (keys >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    keys = (keys ^ (keys >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return keys ^ (keys >> np.uint64(31))
+
+
+def xor_keys(keys):
+    """XOR of the `mix64` keys of a NumPy vector, as a Python int"""
+    return int(np.bitwise_xor.reduce(mix64_array(keys), initial=0))
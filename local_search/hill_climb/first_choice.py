@@ -0,0 +1,41 @@
+from .hill_climb import HillClimb
+
+
+class FirstChoice(HillClimb):
+    """
+    First-choice hill climbing.
+    Draws distinct random moves, up to `max_samples` per step, and takes
+    the first one that improves on the current state. Only when none of
+    them does is the whole neighborhood scanned, which either finds the
+    best improving move or confirms a local optimum.
+    """
+
+    def __init__(self, initial_state, max_steps=1000, max_samples=100, **kwargs):
+        super().__init__(initial_state, max_steps, **kwargs)
+        self.max_samples = max_samples
+
+    def step(self):
+        state = self.state
+        value = state.value
+        tried = set()
+        for _ in range(self.max_samples):
+            move = state.random_move(self.rng)
+            if move is None:
+                return False
+            if move in tried:
+                continue
+            tried.add(move)
+
+            self.evaluations += 1
+            if state.move_value(move) < value:
+                state.apply(move)
+                self.accepted_moves += 1
+                return True
+
+        best_move, best_value = self.best_move()
+        if best_move is not None and best_value < value:
+            state.apply(best_move)
+            self.accepted_moves += 1
+            return True
+
+        return False
@@ -1,16 +1,24 @@
 from abc import abstractmethod
+import numpy as np
 from ..search_algorithm import SearchAlgorithm
 
 
 class HillClimb(SearchAlgorithm):
     """
     Base class for Hill Climbing algorithms.
-    Assumes `state` has `neighbors` property and `value` attribute.
+    Assumes `state` follows the `MoveState` protocol and has a `value`
+    attribute to minimize.
+
+    When `vectorized` is set and the state provides `move_value_matrix`,
+    the best neighbor is found with a single argmin over all move values.
+    Climbs never make the state worse, so the current state is also the
+    best one seen when a deadline stops the search.
     """
 
-    def __init__(self, initial_state, max_steps=1000, **kwargs):
+    def __init__(self, initial_state, max_steps=1000, vectorized=True, **kwargs):
         super().__init__(initial_state, **kwargs)
         self.max_steps = max_steps
+        self.vectorized = vectorized
         self.current_step = 0
 
     @abstractmethod
@@ -22,22 +30,55 @@ class HillClimb(SearchAlgorithm):
         """
         pass
 
-    def search(self):
+    def best_move(self):
+        """
+        Returns (move, value) for the lowest-valued neighbor, or (None, None)
+        if the state has no moves. Ties go to the first move in `iter_moves`
+        order, which `argmin` over the move matrix reproduces.
+        """
+        state = self.state
+        if self.vectorized and hasattr(state, "move_value_matrix"):
+            values = state.move_value_matrix()
+            self.evaluations += values.size
+            index = int(np.argmin(values))
+            best_value = values.flat[index]
+            if best_value == np.iinfo(values.dtype).max:
+                return None, None
+            move = tuple(int(i) for i in np.unravel_index(index, values.shape))
+            return move, int(best_value)
+
+        best_move = None
+        best_value = None
+        for move in state.iter_moves():
+            value = state.move_value(move)
+            self.evaluations += 1
+            if best_value is None or value < best_value:
+                best_value = value
+                best_move = move
+        return best_move, best_value
+
+    def iter_search(self, every=1):
         """
         Executes the hill climbing search.
         Returns the final state (either a goal or a local optimum).
         """
         self.current_step = 0
+        step = self.stepper()
+        countdown = every
         while self.current_step < self.max_steps:
             if self.state.is_goal():
-                return self.state
+                break
 
-            made_move = self.step()
+            made_move = step()
             if not made_move:
-                return self.state
+                break
 
             self.current_step += 1
-        return self.state
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield self.progress()
+        return self.finish(self.state)
 
 
 class BasicHillClimb(HillClimb):
@@ -50,17 +91,11 @@ class BasicHillClimb(HillClimb):
         Performs one step of basic hill climbing.
         Returns True if a move was made, False if stuck at local optimum.
         """
-        current_value = self.state.value
-        best_neighbor = None
-        best_value = current_value
-
-        for neighbor in self.state.neighbors:
-            if neighbor.value > best_value:
-                best_value = neighbor.value
-                best_neighbor = neighbor
+        best_move, best_value = self.best_move()
 
-        if best_neighbor is not None:
-            self.state = best_neighbor
+        if best_move is not None and best_value < self.state.value:
+            self.state.apply(best_move)
+            self.accepted_moves += 1
             return True
 
         return False
@@ -1,18 +1,178 @@
-from .hill_climb import HillClimb
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+import numpy as np
+from ..observers import ProgressRecord
+from .hill_climb import BasicHillClimb
+
+_stop_event = None
+
+
+def _init_worker(stop_event):
+    """Share the first-solution stop flag with a pool worker"""
+    global _stop_event
+    _stop_event = stop_event
+
+
+def restart_seed(entropy, index):
+    """
+    Seed for restart `index` of a run seeded with `entropy`. Each restart
+    owns a spawned child of one `SeedSequence`, so results do not depend on
+    how restarts are split across workers.
+    """
+    sequence = np.random.SeedSequence(entropy, spawn_key=(index,))
+    return int(sequence.generate_state(1, np.uint64)[0])
+
+
+def _preferred(state, index, best_state, best_index):
+    """
+    Whether restart `index` ending in `state` beats the best so far: the
+    lowest-index goal wins, then the lowest (value, index), whatever order
+    the restarts finish in.
+    """
+    if best_state is None:
+        return True
+    if state.is_goal() or best_state.is_goal():
+        return state.is_goal() and (not best_state.is_goal() or index < best_index)
+    return (state.value, index) < (best_state.value, best_index)
+
+
+def _run_restart(
+    problem, hill_climb_variant, variant_kwargs, entropy, index, deadline=None
+):
+    """
+    Run restart `index` from its own random initial state.
+    Returns the final state and the number of evaluations. In a pool
+    worker, the climb stops as soon as any worker finds a goal.
+    """
+    seed = restart_seed(entropy, index)
+    initial_state = problem.generate_random_initial_state(random.Random(seed))
+    should_stop = None if _stop_event is None else _stop_event.is_set
+    climb = hill_climb_variant(
+        initial_state,
+        seed=seed,
+        deadline=deadline,
+        should_stop=should_stop,
+        **variant_kwargs,
+    )
+    return climb.search(), getattr(climb, "evaluations", 0)
+
+
+def _run_restarts(
+    problem, hill_climb_variant, variant_kwargs, entropy, start, count, deadline
+):
+    """
+    Run restarts `start` .. `start + count` in a worker process and return
+    the best state, its restart index, the evaluations made and the number
+    of restarts run. Stops early, abandoning a running climb, when any
+    worker has found a goal or the deadline has passed.
+    """
+    best_state_found = None
+    best_index = None
+    evaluations = 0
+    finished = 0
+    for index in range(start, start + count):
+        if _stop_event is not None and _stop_event.is_set():
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+
+        final_state, restart_evaluations = _run_restart(
+            problem, hill_climb_variant, variant_kwargs, entropy, index, deadline
+        )
+        evaluations += restart_evaluations
+        finished += 1
+
+        if _preferred(final_state, index, best_state_found, best_index):
+            best_state_found = final_state
+            best_index = index
+        if final_state.is_goal():
+            if _stop_event is not None:
+                _stop_event.set()
+            break
+
+    return best_state_found, best_index, evaluations, finished
 
 
 class RandomRestart:
-    def __init__(self, problem, hill_climb_variant=HillClimb, max_restarts=1000):
+    """
+    Restarts a hill climbing variant from fresh initial states until one
+    reaches a goal.
+
+    `workers` > 1 runs restarts on a process pool in chunks of `chunk_size`.
+    `time_budget` (seconds) and `deadline` (a `time.monotonic()` value) cap
+    the wall time. `seed` makes each restart reproducible (see
+    `restart_seed`). Extra keyword arguments are passed to the variant.
+    """
+
+    def __init__(
+        self,
+        problem,
+        hill_climb_variant=BasicHillClimb,
+        max_restarts=1000,
+        workers=None,
+        chunk_size=1,
+        time_budget=None,
+        deadline=None,
+        seed=None,
+        **kwargs,
+    ):
         self.problem = problem
         self.hill_climb_variant = hill_climb_variant
         self.max_restarts = max_restarts
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.time_budget = time_budget
+        self.deadline = deadline
+        self.seed = seed
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self.variant_kwargs = kwargs
+        self.evaluations = 0
+        self.result = None
+
+    def _deadline(self):
+        deadline = self.deadline
+        if self.time_budget is not None:
+            budget_end = time.monotonic() + self.time_budget
+            deadline = budget_end if deadline is None else min(deadline, budget_end)
+        return deadline
 
     def search(self):
+        for _ in self.iter_search(every=0):
+            pass
+        return self.result
+
+    def iter_search(self, every=1):
+        """
+        Runs the restarts as a generator that yields a `ProgressRecord`
+        after every `every` restarts, or never when `every` is 0. A record's
+        `step` counts finished restarts and `value` is where the last one
+        ended. The best state is returned and stored in `result`.
+        """
+        if self.workers is not None and self.workers > 1:
+            self.result = yield from self._iter_parallel(every)
+        else:
+            self.result = yield from self._iter_sequential(every)
+        return self.result
+
+    def _iter_sequential(self, every):
+        deadline = self._deadline()
         best_state_found = None
+        countdown = every
         for i in range(self.max_restarts):
-            initial_state = self.problem.generate_random_initial_state()
-            hc_solver = self.hill_climb_variant(initial_state)
-            final_state = hc_solver.search()
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            final_state, evaluations = _run_restart(
+                self.problem,
+                self.hill_climb_variant,
+                self.variant_kwargs,
+                self.entropy,
+                i,
+                deadline,
+            )
+            self.evaluations += evaluations
 
             if final_state and final_state.is_goal():
                 return final_state
@@ -20,6 +180,84 @@ class RandomRestart:
             if best_state_found is None or final_state.value < best_state_found.value:
                 best_state_found = final_state
 
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield ProgressRecord(i + 1, final_state.value, best_state_found.value)
+
+        return best_state_found
+
+    def _iter_parallel(self, every):
+        """Fan restarts out over worker processes in chunks"""
+        deadline = self._deadline()
+        stop_event = multiprocessing.Event()
+        best_state_found = None
+        best_index = None
+        finished = 0
+        countdown = every
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(stop_event,),
+        )
+        chunks = iter(range(0, self.max_restarts, self.chunk_size))
+
+        def submit_next():
+            start = next(chunks, None)
+            if start is None or stop_event.is_set():
+                return
+            pending.add(
+                executor.submit(
+                    _run_restarts,
+                    self.problem,
+                    self.hill_climb_variant,
+                    self.variant_kwargs,
+                    self.entropy,
+                    start,
+                    min(self.chunk_size, self.max_restarts - start),
+                    deadline,
+                )
+            )
+
+        pending = set()
+        try:
+            # Keep a couple of chunks queued per worker instead of all of them
+            for _ in range(2 * self.workers):
+                submit_next()
+
+            while pending:
+                timeout = (
+                    None if deadline is None else max(0, deadline - time.monotonic())
+                )
+                done, pending = wait(pending, timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Out of time: stop every climb and collect the running chunks
+                    stop_event.set()
+                    deadline = None
+                    continue
+
+                for future in done:
+                    final_state, index, evaluations, count = future.result()
+                    self.evaluations += evaluations
+                    finished += count
+                    submit_next()
+                    if final_state is None:
+                        continue
+                    if _preferred(final_state, index, best_state_found, best_index):
+                        best_state_found = final_state
+                        best_index = index
+
+                    countdown -= 1
+                    if countdown == 0:
+                        countdown = every
+                        yield ProgressRecord(
+                            finished, final_state.value, best_state_found.value
+                        )
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
         return best_state_found
 
     def step(self):
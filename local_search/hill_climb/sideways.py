@@ -8,23 +8,22 @@ class Sideways(HillClimb):
         self.sideways_count = 0
 
     def step(self):
-        neighbors = self.state.neighbors
-        if not neighbors:
-            return False
+        state = self.state
+        best_move, best_value = self.best_move()
 
-        best_neighbor = min(neighbors, key=lambda x: x.value)
+        if best_move is None:
+            return False
 
-        current_value = self.state.value
+        current_value = state.value
 
-        if best_neighbor.value < current_value:
-            self.state = best_neighbor
+        if best_value < current_value:
+            state.apply(best_move)
+            self.accepted_moves += 1
             self.sideways_count = 0
             return True
-        elif (
-            best_neighbor.value == current_value
-            and self.sideways_count < self.sideways_limit
-        ):
-            self.state = best_neighbor
+        elif best_value == current_value and self.sideways_count < self.sideways_limit:
+            state.apply(best_move)
+            self.accepted_moves += 1
             self.sideways_count += 1
             return True
 
@@ -1,4 +1,3 @@
-import random
 from .hill_climb import HillClimb
 
 
@@ -7,13 +6,14 @@ class Stochastic(HillClimb):
         super().__init__(initial_state, max_steps, **kwargs)
 
     def step(self):
-        neighbors = self.state.neighbors
-        if not neighbors:
+        state = self.state
+        move = state.random_move(self.rng)
+        if move is None:
             return False
 
-        random_neighbor = random.choice(neighbors)
-
-        if random_neighbor.value < self.state.value:
-            self.state = random_neighbor
+        self.evaluations += 1
+        if state.move_value(move) < state.value:
+            state.apply(move)
+            self.accepted_moves += 1
 
         return True
@@ -2,30 +2,73 @@ from .local_search_parser import LocalSearchParser
 
 
 class LocalSearch:
-    """Local search using algorithm parser pattern"""
+    """
+    Local search using algorithm parser pattern.
+    `deadline` (a `time.monotonic()` value) and `time_budget` (seconds per
+    search) are handed to the algorithm, which then returns its best state
+    by that time. `resume_from` loads a checkpoint written by an algorithm
+    that supports them, such as simulated annealing with `checkpoint_path`.
+    """
 
     def __init__(
-        self, initial_state, algorithm=None, algorithm_name: str = None, **kwargs
+        self,
+        initial_state,
+        algorithm=None,
+        algorithm_name: str = None,
+        deadline=None,
+        time_budget=None,
+        resume_from=None,
+        **kwargs,
     ):
         self.initial_state = initial_state
+        self.deadline = deadline
+        self.time_budget = time_budget
 
         if algorithm is not None:
             self.algorithm = algorithm
-        elif algorithm_name is not None:
-            parser = LocalSearchParser()
-            self.algorithm = parser.parse(
-                algorithm_name, initial_state=initial_state, **kwargs
-            )
+            self._apply_time_limits()
         else:
-            parser = LocalSearchParser()
-            self.algorithm = parser.parse(
-                "hill_climb", initial_state=initial_state, **kwargs
-            )
+            self.set_algorithm(algorithm_name or "hill_climb", **kwargs)
+
+        if resume_from is not None:
+            if not hasattr(self.algorithm, "resume"):
+                raise TypeError(
+                    f"{self.get_algorithm_name()} does not support resuming "
+                    "from a checkpoint"
+                )
+            self.algorithm.resume(resume_from)
+
+    def _time_limits(self):
+        limits = {}
+        if self.deadline is not None:
+            limits["deadline"] = self.deadline
+        if self.time_budget is not None:
+            limits["time_budget"] = self.time_budget
+        return limits
+
+    def _apply_time_limits(self):
+        for name, limit in self._time_limits().items():
+            setattr(self.algorithm, name, limit)
 
     def search(self):
         """Execute the search algorithm"""
         return self.algorithm.search()
 
+    def iter_search(self, every=1):
+        """
+        Execute the search algorithm as a generator of `ProgressRecord`s,
+        one after every `every` steps. Records carry values only, so the
+        consumer may stream them, stop early by breaking out, or interleave
+        several searches in one thread. The final state is the generator's
+        return value and `result` once it is exhausted.
+        """
+        return self.algorithm.iter_search(every)
+
+    @property
+    def result(self):
+        """Final state of the last completed search, or None"""
+        return self.algorithm.result
+
     def step(self):
         """Perform one step of the algorithm"""
         return self.algorithm.step()
@@ -38,7 +81,10 @@ class LocalSearch:
         """Change algorithm by name"""
         parser = LocalSearchParser()
         self.algorithm = parser.parse(
-            algorithm_name, initial_state=self.initial_state, **kwargs
+            algorithm_name,
+            initial_state=self.initial_state,
+            **self._time_limits(),
+            **kwargs,
         )
 
     def get_algorithm_name(self) -> str:
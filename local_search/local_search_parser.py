@@ -2,21 +2,44 @@ from .search_algorithm import SearchAlgorithm
 from .hill_climb.hill_climb import BasicHillClimb
 from .hill_climb.sideways import Sideways
 from .hill_climb.stochastic import Stochastic
+from .hill_climb.first_choice import FirstChoice
 from .hill_climb.random_restart import RandomRestart
+from .min_conflicts.min_conflicts import MinConflicts
+from .tabu.tabu_search import TabuSearch
 from .simulated_annealing.maximization_simulated_annealing import (
     MaximizationSimulatedAnnealing,
 )
 from .simulated_annealing.minimization_simulated_annealing import (
     MinimizationSimulatedAnnealing,
 )
+from .simulated_annealing.batched_simulated_annealing import (
+    BatchedSimulatedAnnealing,
+)
+from .simulated_annealing.parallel_tempering import ParallelTempering
 from .simulated_annealing.cooling_strategy import (
     ExponentialCooling,
     LinearCooling,
     LogarithmicCooling,
     InverseCooling,
+    AdaptiveCooling,
 )
 
 
+class ProblemWrapper:
+    """
+    Problem built around an initial state. Random initial states come from
+    the state's `random_like(rng)`; states without it are restarted as is.
+    """
+
+    def __init__(self, initial_state):
+        self.initial_state = initial_state
+
+    def generate_random_initial_state(self, rng=None):
+        if hasattr(self.initial_state, "random_like"):
+            return self.initial_state.random_like(rng)
+        return self.initial_state
+
+
 class LocalSearchParser:
     """Parser to create local search algorithm instances from string names"""
 
@@ -28,9 +51,17 @@ class LocalSearchParser:
             "sideways_hill_climb": Sideways,
             "stochastic": Stochastic,
             "stochastic_hill_climb": Stochastic,
+            "first_choice": FirstChoice,
+            "first_choice_hill_climb": FirstChoice,
             "random_restart": self._create_random_restart,
+            "min_conflicts": MinConflicts,
+            "tabu": TabuSearch,
+            "tabu_search": TabuSearch,
             "minimization_sa": MinimizationSimulatedAnnealing,
             "maximization_sa": MaximizationSimulatedAnnealing,
+            "batched_sa": BatchedSimulatedAnnealing,
+            "parallel_tempering": ParallelTempering,
+            "replica_exchange": ParallelTempering,
         }
 
         self._cooling_strategies = {
@@ -38,6 +69,7 @@ class LocalSearchParser:
             "linear": LinearCooling,
             "logarithmic": LogarithmicCooling,
             "inverse": InverseCooling,
+            "adaptive": AdaptiveCooling,
         }
 
     def parse(self, algorithm_name: str, **kwargs) -> SearchAlgorithm:
@@ -52,6 +84,10 @@ class LocalSearchParser:
 
         algorithm_class_or_func = self._algorithms[algorithm_name]
 
+        cooling_strategy = kwargs.get("cooling_strategy")
+        if isinstance(cooling_strategy, str):
+            kwargs["cooling_strategy"] = self.parse_cooling_strategy(cooling_strategy)
+
         if callable(algorithm_class_or_func) and not hasattr(
             algorithm_class_or_func, "__bases__"
         ):
@@ -68,19 +104,35 @@ class LocalSearchParser:
         else:
             variant_class = hill_climb_variant
 
-        class ProblemWrapper:
-            def __init__(self, initial_state):
-                self.initial_state = initial_state
-
-            def generate_random_initial_state(self):
-                return self.initial_state
-
         problem = ProblemWrapper(initial_state)
         return RandomRestart(problem, variant_class, **kwargs)
 
-    def get_available_algorithms(self) -> list:
-        """Get list of available algorithm names"""
-        return list(self._algorithms.keys())
+    def get_available_algorithms(self, include_aliases=True) -> list:
+        """
+        Get list of available algorithm names.
+        Without aliases, only the first name registered for each algorithm
+        is listed.
+        """
+        if include_aliases:
+            return list(self._algorithms.keys())
+
+        names = []
+        seen = []
+        for name, algorithm in self._algorithms.items():
+            if algorithm not in seen:
+                seen.append(algorithm)
+                names.append(name)
+        return names
+
+    def parse_cooling_strategy(self, name: str, **kwargs):
+        """Parse cooling strategy name and return a strategy instance"""
+        name = name.lower().strip()
+        if name not in self._cooling_strategies:
+            available = ", ".join(self._cooling_strategies.keys())
+            raise ValueError(
+                f"Unknown cooling strategy '{name}'. Available: {available}"
+            )
+        return self._cooling_strategies[name](**kwargs)
 
     def get_available_cooling_strategies(self) -> list:
         """Get list of available cooling strategies for SA"""
@@ -1,48 +1,83 @@
-from .games.n_queens import solve_n_queens, interactive_demo
+import argparse
+import random
+import sys
+from .batch import run_batch
+from .games.n_queens import solve_n_queens
+from .games.tsp import TSPInstance, read_tsplib, solve_tsp
 from .local_search_parser import LocalSearchParser
 
 
-if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ["--help", "-h"]:
-            parser = LocalSearchParser()
-            available = parser.get_available_algorithms()
-            print("Local Search Main Entry Point")
-            print("Usage: uv run -m local_search.main [options]")
-            print()
-            print("Available games:")
-            print("  n_queens  - N-Queens problem solver")
-            print()
-            print("Examples:")
-            print("  uv run -m local_search.main n_queens hill_climb 8 5")
-            print("  uv run -m local_search.games.n_queens simulated_annealing 10")
-            print("  uv run -m local_search.games.n_queens --help")
-            print()
-            print(f"Available algorithms: {', '.join(available)}")
-            sys.exit(0)
-        elif sys.argv[1] == "n_queens":
-            sys.argv = sys.argv[:1] + sys.argv[2:]
-            if len(sys.argv) > 1:
-                algorithm_name = sys.argv[1] if len(sys.argv) > 1 else "hill_climb"
-                n = int(sys.argv[2]) if len(sys.argv) > 2 else 8
-                max_attempts = int(sys.argv[3]) if len(sys.argv) > 3 else 10
-
-                try:
-                    solve_n_queens(n, algorithm_name, max_attempts)
-                except ValueError as e:
-                    print(f"Error: {e}")
-                    parser = LocalSearchParser()
-                    available = parser.get_available_algorithms()
-                    print(f"Available algorithms: {', '.join(available)}")
+def build_parser():
+    available = ", ".join(LocalSearchParser().get_available_algorithms())
+    parser = argparse.ArgumentParser(
+        prog="uv run -m local_search.main",
+        description="Local Search Main Entry Point",
+        epilog=f"Available algorithms: {available}",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    n_queens = commands.add_parser("n_queens", help="solve one N-Queens board")
+    n_queens.add_argument("algorithm", nargs="?", default="hill_climb")
+    n_queens.add_argument("n", nargs="?", type=int, default=8)
+    n_queens.add_argument("max_steps", nargs="?", type=int, default=10)
+    n_queens.add_argument("--seed", type=int)
+
+    tsp = commands.add_parser("tsp", help="improve one TSP tour")
+    tsp.add_argument("source", help="TSPLIB file, or a number of random cities")
+    tsp.add_argument("algorithm", nargs="?", default="first_choice")
+    tsp.add_argument("max_steps", nargs="?", type=int, default=100000)
+    tsp.add_argument("--seed", type=int)
+
+    batch = commands.add_parser(
+        "batch",
+        help="run a JSONL file of jobs",
+        description=(
+            "Run jobs from a JSONL file, one object per line with optional "
+            "'id', 'problem' (n_queens or tsp), 'n', 'algorithm', 'kwargs' and "
+            "'seed'. Results are written to OUTPUT as they finish."
+        ),
+    )
+    batch.add_argument("jobs", help="JSONL file of jobs")
+    batch.add_argument("-o", "--output", required=True, help="JSONL results file")
+    batch.add_argument("-w", "--workers", type=int, default=1)
+    batch.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip jobs already in OUTPUT without an error",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Command line entry point: `python -m local_search.main`"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == "batch":
+        run_batch(args.jobs, args.output, args.workers, args.resume)
+        return 0
+
+    try:
+        if args.command == "n_queens":
+            solve_n_queens(args.n, args.algorithm, args.max_steps, seed=args.seed)
+        elif args.command == "tsp":
+            if args.source.isdigit():
+                instance = TSPInstance.random(
+                    int(args.source), random.Random(args.seed)
+                )
             else:
-                interactive_demo()
+                instance = read_tsplib(args.source)
+            solve_tsp(instance, args.algorithm, args.max_steps, seed=args.seed)
         else:
-            print(f"Unknown game: {sys.argv[1]}")
-            print("Available games: n_queens")
-            print("Use --help for more information")
-    else:
-        print("Local Search Framework")
-        print("Use --help for usage information")
-        print("Quick start: uv run -m local_search.games.n_queens")
+            print("Local Search Framework")
+            print("Use --help for usage information")
+            print("Quick start: uv run -m local_search.games.n_queens")
+    except ValueError as e:
+        print(f"Error: {e}")
+        available = LocalSearchParser().get_available_algorithms()
+        print(f"Available algorithms: {', '.join(available)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
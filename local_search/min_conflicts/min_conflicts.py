@@ -0,0 +1,108 @@
+from ..games.state import UnsupportedStateError
+from ..search_algorithm import SearchAlgorithm
+
+
+class MinConflicts(SearchAlgorithm):
+    """
+    Min-conflicts local search for CSP-like states.
+    Assumes `state` provides `conflicts(var)`, `conflicted()` and
+    `repair(var, rng)`, plus optionally `greedy_initialize(rng)`.
+
+    A set of conflicted variables is kept up to date incrementally: every
+    attacked pair always has at least one endpoint in the set, so the state
+    is a goal as soon as the set is empty. Repairs that do not lower the
+    value are rare after greedy initialization and trigger a full rescan.
+    Each repair counts as one evaluation. On a deadline the current state
+    is returned: repairs almost always lower the value, and snapshotting
+    very large boards on every improvement would cost more than it saves.
+    """
+
+    def __init__(self, initial_state, max_steps=100000, greedy_init=True, **kwargs):
+        super().__init__(initial_state, **kwargs)
+        for hook in ("conflicts", "conflicted", "repair"):
+            if not hasattr(self.state, hook):
+                raise UnsupportedStateError(
+                    f"MinConflicts requires a state with a '{hook}' method, "
+                    f"got {type(self.state).__name__}"
+                )
+        self.max_steps = max_steps
+        self.greedy_init = greedy_init
+        self.current_step = 0
+        self._conflicted = None
+        self._members = None
+
+    def _prepare(self):
+        """Greedily initialize the state and collect conflicted variables"""
+        if self.greedy_init and hasattr(self.state, "greedy_initialize"):
+            self.state.greedy_initialize(self.rng)
+        self._conflicted = self.state.conflicted()
+        self._members = set(self._conflicted)
+
+    def _mark(self, var):
+        if var not in self._members and self.state.conflicts(var):
+            self._members.add(var)
+            self._conflicted.append(var)
+
+    def step(self):
+        """
+        Repairs one random conflicted variable.
+        Returns False once no variable is in conflict.
+        """
+        if self._conflicted is None:
+            self._prepare()
+
+        conflicted = self._conflicted
+        state = self.state
+        while conflicted:
+            index = self.rng.randrange(len(conflicted))
+            var = conflicted[index]
+            conflicted[index] = conflicted[-1]
+            conflicted.pop()
+            self._members.discard(var)
+
+            if not state.conflicts(var):
+                continue
+
+            value = state.value
+            changed = state.repair(var, self.rng)
+            self.evaluations += 1
+            if state.value < value:
+                for other in changed:
+                    self._mark(other)
+                self._mark(var)
+            else:
+                # A sideways or uphill repair may strand attacked pairs outside
+                # the set, so rescan instead of tracking them one by one
+                self._conflicted = conflicted = state.conflicted()
+                self._members = set(conflicted)
+            return True
+
+        return False
+
+    def iter_search(self, every=1):
+        """
+        Executes min-conflicts until no variable is in conflict or
+        `max_steps` repairs have been made.
+        """
+        self.current_step = 0
+        self._prepare()
+        step = self.stepper()
+        countdown = every
+        while self.current_step < self.max_steps:
+            if self.state.is_goal():
+                break
+
+            if not step():
+                break
+
+            self.current_step += 1
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield self.progress()
+        return self.finish(self.state)
+
+    def reset(self):
+        super().reset()
+        self._conflicted = None
+        self._members = None
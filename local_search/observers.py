@@ -0,0 +1,192 @@
+import json
+from collections import Counter
+
+
+class StepRecord:
+    """Snapshot of an algorithm after one step, handed to observers"""
+
+    __slots__ = (
+        "accepted_moves",
+        "evaluations",
+        "plateau",
+        "step",
+        "temperature",
+        "value",
+    )
+    _fields = (
+        "step",
+        "value",
+        "evaluations",
+        "accepted_moves",
+        "plateau",
+        "temperature",
+    )
+
+    def __init__(
+        self, step, value, evaluations, accepted_moves, plateau, temperature=None
+    ):
+        self.step = step
+        self.value = value
+        self.evaluations = evaluations
+        self.accepted_moves = accepted_moves
+        self.plateau = plateau
+        self.temperature = temperature
+
+    @property
+    def acceptance_rate(self):
+        """Fraction of steps so far that applied a move"""
+        return self.accepted_moves / self.step if self.step else 0.0
+
+    def as_dict(self):
+        record = {name: getattr(self, name) for name in self._fields}
+        record["acceptance_rate"] = self.acceptance_rate
+        return record
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"StepRecord({fields})"
+
+
+class ProgressRecord:
+    """
+    Progress of a search yielded by `iter_search`: the step count, the
+    current and best values and the temperature, if the algorithm has one.
+    Holds no reference to any state.
+    """
+
+    __slots__ = ("best_value", "step", "temperature", "value")
+    _fields = ("step", "value", "best_value", "temperature")
+
+    def __init__(self, step, value, best_value, temperature=None):
+        self.step = step
+        self.value = value
+        self.best_value = best_value
+        self.temperature = temperature
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"ProgressRecord({fields})"
+
+
+class SearchObserver:
+    """
+    Base class for search observers. Algorithms call `on_start` before the
+    first step, `on_step` after every `every`-th step and `on_finish` with
+    the returned state. Override only the callbacks you need.
+
+    `plateau` in a record is the number of consecutive steps the value has
+    not changed; `accepted_moves` and `evaluations` are running counters.
+    """
+
+    def __init__(self, every=1):
+        self.every = every
+
+    def on_start(self, algorithm):
+        pass
+
+    def on_step(self, algorithm, record):
+        pass
+
+    def on_finish(self, algorithm, state):
+        pass
+
+    def close(self):
+        """
+        Release anything held for the run. `search` calls it when it ends,
+        including on an exception; observers used with `iter_search` can be
+        closed with a `with` block.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TraceCollector(SearchObserver):
+    """Keeps every sampled record in memory, up to `max_records`"""
+
+    def __init__(self, every=1, max_records=None):
+        super().__init__(every)
+        self.max_records = max_records
+        self.records = []
+
+    def on_step(self, algorithm, record):
+        if self.max_records is None or len(self.records) < self.max_records:
+            self.records.append(record)
+
+
+class JsonlWriter(SearchObserver):
+    """
+    Streams sampled records as JSON lines to `target`, a path or an open
+    text file. A path is opened on start and closed on finish or `close`;
+    an open file is only flushed.
+    """
+
+    def __init__(self, target, every=1):
+        super().__init__(every)
+        self.target = target
+        self._file = None
+
+    def on_start(self, algorithm):
+        if isinstance(self.target, str):
+            self._file = open(self.target, "w")  # noqa: SIM115 closed by close()
+        else:
+            self._file = self.target
+        self._write({"event": "start", "algorithm": type(algorithm).__name__})
+
+    def on_step(self, algorithm, record):
+        self._write(record.as_dict())
+
+    def on_finish(self, algorithm, state):
+        self._write({"event": "finish", "value": state.value})
+        self.close()
+
+    def close(self):
+        if self._file is None:
+            return
+        if isinstance(self.target, str):
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+
+    def _write(self, payload):
+        self._file.write(json.dumps(payload) + "\n")
+
+
+class HistogramCollector(SearchObserver):
+    """
+    Aggregates sampled records into histograms of values and plateau
+    lengths, keeping only counts so memory does not grow with the run.
+    """
+
+    def __init__(self, every=1):
+        super().__init__(every)
+        self.values = Counter()
+        self.plateaus = Counter()
+        self.last = None
+
+    def on_step(self, algorithm, record):
+        self.values[record.value] += 1
+        self.plateaus[record.plateau] += 1
+        self.last = record
+
+    def summary(self):
+        """Totals of the run so far, from the last sampled record"""
+        last = self.last
+        if last is None:
+            return {}
+        return {
+            "steps": last.step,
+            "evaluations": last.evaluations,
+            "evaluations_per_step": last.evaluations / last.step,
+            "acceptance_rate": last.acceptance_rate,
+            "longest_plateau": max(self.plateaus),
+            "values": dict(sorted(self.values.items())),
+        }
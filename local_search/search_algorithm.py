@@ -1,16 +1,97 @@
+import time
 from abc import ABC, abstractmethod
+from .buffered_random import BufferedRandom
+from .games.state import NeighborsAdapter, as_move_state
+from .observers import ProgressRecord, StepRecord
+
+# Target seconds between clock reads
+_CHECK_PERIOD = 0.001
+
+
+def with_clock(step, on_tick):
+    """
+    Wrap `step` so `on_tick(now)` runs with `time.monotonic()` before some
+    steps; a False result stops the search by returning False instead of
+    stepping. The clock is read every `interval` steps, with the interval
+    doubled or halved so reads happen about once per `_CHECK_PERIOD`,
+    however long a step takes.
+    """
+    interval = 1
+    countdown = 1
+    last_check = time.monotonic()
+
+    def clocked_step():
+        nonlocal interval, countdown, last_check
+        countdown -= 1
+        if countdown == 0:
+            now = time.monotonic()
+            if not on_tick(now):
+                return False
+            elapsed = now - last_check
+            last_check = now
+            if elapsed < _CHECK_PERIOD / 2:
+                interval *= 2
+            elif elapsed > _CHECK_PERIOD * 2 and interval > 1:
+                interval //= 2
+            countdown = interval
+        return step()
+
+    return clocked_step
 
 
 class SearchAlgorithm(ABC):
-    """Base interface for local search algorithms"""
+    """
+    Base interface for local search algorithms.
 
-    def __init__(self, initial_state, **kwargs):
-        self.state = initial_state
+    `seed` seeds `rng`, a `BufferedRandom`. `observer` is a `SearchObserver`.
+    `deadline` (a `time.monotonic()` value) and `time_budget` (seconds) bound
+    the wall time, and `should_stop` ends a search when it returns True.
+    Subclasses implement `iter_search`; `search` runs it to the end.
+    """
+
+    def __init__(
+        self,
+        initial_state,
+        seed=None,
+        observer=None,
+        deadline=None,
+        time_budget=None,
+        should_stop=None,
+        **kwargs,
+    ):
         self.initial_state = initial_state
+        self.seed = seed
+        self.rng = BufferedRandom(seed)
+        self.evaluations = 0
+        self.accepted_moves = 0
+        self.observer = observer
+        self.deadline = deadline
+        self.time_budget = time_budget
+        self.should_stop = should_stop
+        self.timed_out = False
+        self.stop_at = None
+        self.result = None
+        self.state = as_move_state(initial_state).copy()
 
-    @abstractmethod
     def search(self):
         """Execute the search algorithm and return final state"""
+        try:
+            for _ in self.iter_search(every=0):
+                pass
+        finally:
+            if self.observer is not None:
+                self.observer.close()
+        return self.result
+
+    @abstractmethod
+    def iter_search(self, every=1):
+        """
+        Execute the search as a generator that yields a `ProgressRecord`
+        after every `every` steps, or never when `every` is 0. The final
+        state is returned from the generator and stored in `result`.
+        Records hold values only, so yielding never copies a state; a
+        consumer that stops iterating simply stops the search there.
+        """
         pass
 
     @abstractmethod
@@ -18,6 +99,97 @@ class SearchAlgorithm(ABC):
         """Perform one step of the algorithm"""
         pass
 
+    def stop_time(self):
+        """The `time.monotonic()` value at which to stop, or None"""
+        stop = self.deadline
+        if self.time_budget is not None:
+            budget_end = time.monotonic() + self.time_budget
+            stop = budget_end if stop is None else min(stop, budget_end)
+        return stop
+
+    def stepper(self):
+        """
+        Returns the step function for a search loop: `step` itself, or a
+        wrapper that also reports to the observer and stops at the deadline
+        or on `should_stop` when they are set. Call it once at the start of
+        each search.
+        """
+        self.timed_out = False
+        step = self.step
+        if self.observer is not None:
+            step = self._observed(step)
+        self.stop_at = stop = self.stop_time()
+        should_stop = self.should_stop
+        if stop is not None or should_stop is not None:
+
+            def keep_going(now):
+                if stop is not None and now >= stop:
+                    self.timed_out = True
+                    return False
+                return should_stop is None or not should_stop()
+
+            step = with_clock(step, keep_going)
+        return step
+
+    def _observed(self, step):
+        observer = self.observer
+        observer.on_start(self)
+        every = max(1, observer.every)
+        previous_value = self.state.value
+        plateau = 0
+        steps = 0
+
+        def observed_step():
+            nonlocal previous_value, plateau, steps
+            made_move = step()
+            steps += 1
+            value = self.state.value
+            plateau = plateau + 1 if value == previous_value else 0
+            previous_value = value
+            if steps % every == 0:
+                observer.on_step(
+                    self,
+                    StepRecord(
+                        steps,
+                        value,
+                        self.evaluations,
+                        self.accepted_moves,
+                        plateau,
+                        getattr(self, "temperature", None),
+                    ),
+                )
+            return made_move
+
+        return observed_step
+
+    @property
+    def best_value(self):
+        """Value of the best state seen, or of the current state if not tracked"""
+        best_state = getattr(self, "best_state", None)
+        return (self.state if best_state is None else best_state).value
+
+    def progress(self):
+        """A `ProgressRecord` of where the search is now"""
+        return ProgressRecord(
+            getattr(self, "current_step", None),
+            self.state.value,
+            self.best_value,
+            getattr(self, "temperature", None),
+        )
+
+    def finish(self, state):
+        """
+        Report the final state to the observer, if any, store it in
+        `result` and return it. A `NeighborsAdapter` is unwrapped, so
+        callers get back the type of state they passed in.
+        """
+        if isinstance(state, NeighborsAdapter):
+            state = state.state
+        if self.observer is not None:
+            self.observer.on_finish(self, state)
+        self.result = state
+        return state
+
     def reset(self):
         """Reset to initial state"""
-        self.state = self.initial_state
+        self.state = as_move_state(self.initial_state).copy()
@@ -1,9 +1,13 @@
 from .simulated_annealing_base import SimulatedAnnealing
 from .minimization_simulated_annealing import MinimizationSimulatedAnnealing
 from .maximization_simulated_annealing import MaximizationSimulatedAnnealing
+from .batched_simulated_annealing import BatchedSimulatedAnnealing
+from .parallel_tempering import ParallelTempering
 
 __all__ = [
     "SimulatedAnnealing",
     "MinimizationSimulatedAnnealing",
     "MaximizationSimulatedAnnealing",
+    "BatchedSimulatedAnnealing",
+    "ParallelTempering",
 ]
@@ -0,0 +1,152 @@
+import numpy as np
+from ..games.state import UnsupportedStateError
+from ..observers import ProgressRecord
+from ..search_algorithm import SearchAlgorithm
+from .cooling_strategy import ExponentialCooling
+
+
+class BatchedSimulatedAnnealing(SearchAlgorithm):
+    """
+    Simulated Annealing for minimization over K independent chains advanced
+    in lockstep. Each step proposes one random move per chain, scores all of
+    them and applies the Metropolis test as NumPy array operations, so the
+    interpreter overhead is paid once per step instead of once per chain.
+
+    Assumes `state` provides `batch(chains, rng, random_starts)` returning a
+    batch with `propose`, `apply`, `is_goal`, `state` and `values`.
+    `initial_temperature` may be a scalar or one temperature per chain; the
+    cooling strategy is applied to the whole temperature vector. Strategies
+    that need move feedback, such as `AdaptiveCooling`, raise ValueError. A
+    chain stops moving once it reaches a goal or its temperature drops to
+    `min_temperature`. The best board any chain has visited is kept in
+    `best_state` and returned.
+    """
+
+    def __init__(
+        self,
+        initial_state,
+        chains=64,
+        initial_temperature=1000,
+        cooling_rate=0.95,
+        min_temperature=1e-8,
+        max_steps=10000,
+        cooling_strategy=None,
+        random_starts=False,
+        **kwargs,
+    ):
+        super().__init__(initial_state, **kwargs)
+        if not hasattr(self.state, "batch"):
+            raise UnsupportedStateError(
+                "BatchedSimulatedAnnealing requires a state with a 'batch' method, "
+                f"got {type(self.state).__name__}"
+            )
+        self.chains = chains
+        self.initial_temperature = initial_temperature
+        self.min_temperature = min_temperature
+        self.max_steps = max_steps
+        self.random_starts = random_starts
+        self.current_step = 0
+        self.generator = self.rng.generator
+        self.batch = None
+        self.temperatures = None
+        self.initial_temperatures = None
+        self.final_states = []
+        self.best_state = None
+
+        if cooling_strategy is not None:
+            if cooling_strategy.feedback:
+                raise ValueError(
+                    "BatchedSimulatedAnnealing does not feed moves back to its "
+                    "cooling strategy, so it cannot use "
+                    f"{type(cooling_strategy).__name__}"
+                )
+            self.cooling_strategy = cooling_strategy
+        else:
+            self.cooling_strategy = ExponentialCooling(cooling_rate)
+
+    def cool_down(self):
+        """Apply the cooling strategy to every chain's temperature."""
+        cooled = self.cooling_strategy.cool(
+            self.temperatures,
+            self.current_step,
+            initial_temperature=self.initial_temperatures,
+        )
+        self.temperatures = np.broadcast_to(
+            np.asarray(cooled, dtype=float), (self.chains,)
+        ).copy()
+
+    def progress(self):
+        """
+        A `ProgressRecord` with the lowest current chain value and the
+        lowest temperature among the chains still moving; the full vector
+        stays in `temperatures`.
+        """
+        temperatures = self.temperatures
+        active = ~self.batch.is_goal() & (temperatures > self.min_temperature)
+        if active.any():
+            temperatures = temperatures[active]
+        return ProgressRecord(
+            self.current_step,
+            int(self.batch.values.min()),
+            self.best_state.value,
+            float(temperatures.min()),
+        )
+
+    def step(self):
+        """
+        Performs one lockstep step on every active chain.
+        Returns False once no chain is active.
+        """
+        batch = self.batch
+        active = np.flatnonzero(
+            ~batch.is_goal() & (self.temperatures > self.min_temperature)
+        )
+        if len(active) == 0:
+            return False
+
+        cols, rows, deltas = batch.propose(active, self.generator)
+        self.evaluations += len(active)
+        # Threshold form of u < exp(-delta / T), with no exp evaluated
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_uniforms = np.log(self.generator.random(len(active)))
+            accepted = (deltas <= 0) | (
+                log_uniforms * self.temperatures[active] < -deltas
+            )
+
+        batch.apply(active[accepted], cols[accepted], rows[accepted], deltas[accepted])
+        return True
+
+    def iter_search(self, every=1):
+        """
+        Executes all chains and returns the best state visited.
+        Every chain's final state is kept in `final_states`.
+        """
+        self.current_step = 0
+        self.batch = self.state.batch(self.chains, self.generator, self.random_starts)
+        self.initial_temperatures = np.broadcast_to(
+            np.asarray(self.initial_temperature, dtype=float), (self.chains,)
+        ).copy()
+        self.temperatures = self.initial_temperatures.copy()
+        best_chain = int(np.argmin(self.batch.values))
+        self.best_state = self.batch.state(best_chain)
+
+        step = self.stepper()
+        countdown = every
+        while self.current_step < self.max_steps:
+            if not step():
+                break
+
+            best_chain = int(np.argmin(self.batch.values))
+            if self.batch.values[best_chain] < self.best_state.value:
+                self.best_state = self.batch.state(best_chain)
+
+            self.cool_down()
+            self.current_step += 1
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield self.progress()
+
+        self.final_states = [self.batch.state(i) for i in range(self.chains)]
+        self.state = self.best_state
+        return self.finish(self.best_state)
@@ -0,0 +1,48 @@
+import json
+import os
+import struct
+from array import array
+
+MAGIC = b"LSCHKPT1"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def write_checkpoint(path, header, arrays):
+    """
+    Atomically write a checkpoint: `MAGIC`, a length-prefixed JSON `header`
+    and the raw bytes of each `array.array` in `arrays`, a name -> array
+    dict. The file is written next to `path` and renamed over it, so a
+    crash leaves either the old or the new checkpoint, never a torn one.
+    """
+    layout = [
+        {"name": name, "typecode": values.typecode, "length": len(values)}
+        for name, values in arrays.items()
+    ]
+    encoded = json.dumps({**header, "arrays": layout}).encode()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(encoded)))
+        f.write(encoded)
+        for values in arrays.values():
+            values.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path):
+    """Read a checkpoint written by `write_checkpoint` as (header, arrays)"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a local search checkpoint")
+        (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+        header = json.loads(f.read(length))
+
+        arrays = {}
+        for entry in header.pop("arrays"):
+            values = array(entry["typecode"])
+            values.fromfile(f, entry["length"])
+            arrays[entry["name"]] = values
+    return header, arrays
@@ -1,15 +1,49 @@
 from abc import ABC, abstractmethod
 import math
+import numpy as np
 
 
 class CoolingStrategy(ABC):
-    """Abstract base class for cooling strategies"""
+    """
+    Abstract base class for cooling strategies.
+    Temperatures may be floats or NumPy arrays of per-chain temperatures.
+
+    Strategies that set `feedback` are told about every proposed move
+    through `observe`; `prepare` runs when a search starts and may return
+    an initial temperature. Strategies with run state of their own return
+    it from `state_dict` for checkpoints and take it back in `load_state`,
+    which replaces `prepare` when a search resumes. All are no-ops for
+    fixed schedules.
+    """
+
+    feedback = False
 
     @abstractmethod
     def cool(self, current_temperature: float, step: int, **kwargs) -> float:
         """Calculate new temperature based on current temperature and step"""
         pass
 
+    def prepare(self, algorithm):
+        """Called when `algorithm` starts searching; may return a temperature"""
+        return None
+
+    def observe(self, energy_delta, accepted: bool):
+        """Called after each proposed move when `feedback` is set"""
+        pass
+
+    def state_dict(self) -> dict:
+        """JSON-serializable run state to save in a checkpoint"""
+        return {}
+
+    def load_state(self, algorithm, state: dict):
+        """Called instead of `prepare` when `algorithm` resumes from `state`"""
+        pass
+
+
+def _plain(value):
+    """`value` as a plain Python number, so it can be written as JSON"""
+    return value.item() if isinstance(value, np.generic) else value
+
 
 class ExponentialCooling(CoolingStrategy):
     """Exponential cooling: T = T * cooling_rate"""
@@ -28,7 +62,7 @@ class LinearCooling(CoolingStrategy):
         self.cooling_rate = cooling_rate
 
     def cool(self, current_temperature: float, step: int, **kwargs) -> float:
-        return max(0, current_temperature - self.cooling_rate)
+        return np.maximum(0, current_temperature - self.cooling_rate)
 
 
 class LogarithmicCooling(CoolingStrategy):
@@ -57,3 +91,169 @@ class InverseCooling(CoolingStrategy):
         if initial_temperature is None:
             initial_temperature = current_temperature
         return initial_temperature / (1 + self.alpha * step)
+
+
+class AdaptiveCooling(CoolingStrategy):
+    """
+    Closed-loop cooling that steers the acceptance rate of uphill moves.
+
+    The target rate falls from `initial_acceptance` to `final_acceptance`
+    over the first `sweep` fraction of `max_steps`. `samples` random moves
+    set the initial temperature; every `window` uphill moves the temperature
+    goes `gain` of the way to the one that meets the target. After
+    `patience` windows without improvement the target is wound back by
+    `reheat` of the sweep. Temperatures stay between `floor` times the
+    initial temperature and the initial temperature.
+    """
+
+    feedback = True
+
+    def __init__(
+        self,
+        initial_acceptance: float = 0.5,
+        final_acceptance: float = 1e-9,
+        sweep: float = 0.3,
+        window: int = 100,
+        gain: float = 0.5,
+        samples: int = 200,
+        patience: int = 1000,
+        reheat: float = 0.3,
+        floor: float = 1e-4,
+    ):
+        self.initial_acceptance = initial_acceptance
+        self.final_acceptance = final_acceptance
+        self.sweep = sweep
+        self.window = window
+        self.gain = gain
+        self.samples = samples
+        self.patience = patience
+        self.reheat = reheat
+        self.floor = floor
+        self.initial_temperature = None
+        self.acceptance_rate = None
+        self.reheats = 0
+        self._algorithm = None
+        self._next_temperature = None
+
+    def _bind(self, algorithm):
+        self._algorithm = algorithm
+        self._sign = 1 if algorithm.is_improvement(0, 1) else -1
+        self._sweep_steps = max(1, self.sweep * getattr(algorithm, "max_steps", 1))
+
+    def prepare(self, algorithm):
+        self._bind(algorithm)
+        self._sweep_start = 0
+        self._deltas = []
+        self._accepted = 0
+        self._best_value = algorithm.best_state.value
+        self._stale_windows = 0
+        self._next_temperature = None
+        self.acceptance_rate = None
+        self.reheats = 0
+
+        state = algorithm.state
+        deltas = []
+        for _ in range(self.samples):
+            move = state.random_move(algorithm.rng)
+            if move is None:
+                break
+            delta = self._sign * (state.move_value(move) - state.value)
+            if delta > 0:
+                deltas.append(delta)
+        if not deltas:
+            # No uphill move to calibrate on: keep the algorithm's own start
+            self.initial_temperature = algorithm.initial_temperature
+            return None
+
+        mean_delta = sum(deltas) / len(deltas)
+        self.initial_temperature = mean_delta / -math.log(self.initial_acceptance)
+        return self.initial_temperature
+
+    def state_dict(self):
+        return {
+            "initial_temperature": _plain(self.initial_temperature),
+            "acceptance_rate": _plain(self.acceptance_rate),
+            "reheats": self.reheats,
+            "sweep_start": _plain(self._sweep_start),
+            "deltas": [_plain(delta) for delta in self._deltas],
+            "accepted": _plain(self._accepted),
+            "best_value": _plain(self._best_value),
+            "stale_windows": self._stale_windows,
+            "next_temperature": _plain(self._next_temperature),
+        }
+
+    def load_state(self, algorithm, state):
+        self._bind(algorithm)
+        self.initial_temperature = state["initial_temperature"]
+        self.acceptance_rate = state["acceptance_rate"]
+        self.reheats = state["reheats"]
+        self._sweep_start = state["sweep_start"]
+        self._deltas = state["deltas"]
+        self._accepted = state["accepted"]
+        self._best_value = state["best_value"]
+        self._stale_windows = state["stale_windows"]
+        self._next_temperature = state["next_temperature"]
+
+    def target_acceptance(self):
+        """Target uphill acceptance rate at the algorithm's current step"""
+        elapsed = self._algorithm.current_step - self._sweep_start
+        progress = min(1.0, elapsed / self._sweep_steps)
+        ratio = self.final_acceptance / self.initial_acceptance
+        return self.initial_acceptance * ratio**progress
+
+    def observe(self, energy_delta, accepted):
+        delta = self._sign * energy_delta
+        if delta <= 0:
+            return
+        self._deltas.append(delta)
+        self._accepted += accepted
+        if len(self._deltas) < self.window:
+            return
+
+        deltas = np.array(self._deltas, dtype=float)
+        self.acceptance_rate = self._accepted / len(deltas)
+        self._deltas = []
+        self._accepted = 0
+
+        temperature = self._algorithm.temperature
+        solved = self._solve_temperature(deltas, self.target_acceptance())
+        temperature *= (solved / temperature) ** self.gain
+
+        best_value = self._algorithm.best_state.value
+        if self._algorithm.is_improvement(best_value, self._best_value):
+            self._best_value = best_value
+            self._stale_windows = 0
+        else:
+            self._stale_windows += 1
+            if self._stale_windows >= self.patience:
+                step = self._algorithm.current_step
+                progress = min(1.0, (step - self._sweep_start) / self._sweep_steps)
+                progress = max(0.0, progress - self.reheat)
+                self._sweep_start = step - progress * self._sweep_steps
+                temperature = self._solve_temperature(deltas, self.target_acceptance())
+                self._stale_windows = 0
+                self.reheats += 1
+
+        self._next_temperature = temperature
+
+    def _solve_temperature(self, deltas, target):
+        """Temperature where mean(exp(-deltas / T)) equals `target`"""
+        low = self.initial_temperature * self.floor
+        high = self.initial_temperature
+        for _ in range(30):
+            middle = math.sqrt(low * high)
+            if np.exp(-deltas / middle).mean() < target:
+                low = middle
+            else:
+                high = middle
+        return math.sqrt(low * high)
+
+    def cool(self, current_temperature: float, step: int, **kwargs) -> float:
+        temperature = self._next_temperature
+        if temperature is None:
+            return current_temperature
+        self._next_temperature = None
+        return min(
+            max(temperature, self.initial_temperature * self.floor),
+            self.initial_temperature,
+        )
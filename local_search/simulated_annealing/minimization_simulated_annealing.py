@@ -20,3 +20,14 @@ class MinimizationSimulatedAnnealing(SimulatedAnnealing):
         if temperature <= 0:
             return 0.0
         return math.exp(-energy_delta / temperature)
+
+    def accepts(self, energy_delta, temperature):
+        """
+        Threshold form of the Metropolis test: u < e^(-E/T) is log(u) * T < -E,
+        which needs one pre-drawn log-uniform and no exp call.
+        """
+        if energy_delta <= 0:
+            return True
+        if temperature <= 0:
+            return False
+        return self.rng.log_random() * temperature < -energy_delta
@@ -0,0 +1,288 @@
+import multiprocessing
+import numpy as np
+from ..buffered_random import BufferedRandom
+from ..observers import ProgressRecord
+from ..search_algorithm import SearchAlgorithm
+from .minimization_simulated_annealing import MinimizationSimulatedAnnealing
+
+
+class _ReplicaGroup:
+    """
+    Replicas kept resident in one process, keyed by replica id, each with
+    its own fixed-temperature annealer, so a round only has to send
+    temperatures and seeds and get energies back.
+    """
+
+    def __init__(self, states):
+        self.annealers = {
+            replica: MinimizationSimulatedAnnealing(
+                state, cooling_rate=1.0, min_temperature=0
+            )
+            for replica, state in states.items()
+        }
+
+    @property
+    def states(self):
+        return {
+            replica: annealing.state for replica, annealing in self.annealers.items()
+        }
+
+    def run(self, assignments, steps, deadline, best_value):
+        """
+        Run each `(replica, temperature, seed)` for `steps` Metropolis steps.
+        Returns `{replica: (energy, evaluations, best_state)}`, where
+        best_state is None unless it improves on `best_value`.
+        """
+        results = {}
+        for replica, temperature, seed in assignments:
+            annealing = self.annealers[replica]
+            annealing.initial_temperature = temperature
+            annealing.max_steps = steps
+            annealing.deadline = deadline
+            annealing.rng = BufferedRandom(seed)
+            evaluations = annealing.evaluations
+            annealing.search()
+            best_state = annealing.best_state
+            if not best_state.value < best_value:
+                best_state = None
+            results[replica] = (
+                annealing.state.value,
+                annealing.evaluations - evaluations,
+                best_state,
+            )
+        return results
+
+
+def _serve_replicas(connection, states):
+    """
+    Worker loop: run rounds on resident replicas until sent None, then
+    send the final states back.
+    """
+    group = _ReplicaGroup(states)
+    while True:
+        message = connection.recv()
+        if message is None:
+            connection.send(group.states)
+            connection.close()
+            return
+        try:
+            result = group.run(*message)
+        except Exception as error:  # noqa: BLE001 re-raised in the parent
+            result = error
+        connection.send(result)
+
+
+class ParallelTempering(SearchAlgorithm):
+    """
+    Parallel tempering (replica exchange) for minimization problems.
+
+    M replicas run at a geometric ladder of fixed temperatures between
+    `min_temperature` and `max_temperature` (or the explicit `temperatures`).
+    Every `exchange_interval` steps, adjacent rungs (alternating even and odd
+    pairs) swap replicas with probability min(1, exp((1/T_i - 1/T_j) *
+    (E_i - E_j))), letting good configurations found hot sink to the cold
+    end. With `workers` > 1 the replicas are split over that many worker
+    processes and stay there for the whole search: a swap only exchanges
+    the rungs' temperatures, and a state is sent back only when it improves
+    on the best. `max_steps` counts steps per replica. The best state seen
+    is returned; `swap_acceptance_rates` reports the acceptance per rung and
+    `replicas` holds the final state on each rung once the search ends.
+    A deadline is passed down to the replicas, so it also cuts a round short.
+    """
+
+    def __init__(
+        self,
+        initial_state,
+        replicas=8,
+        min_temperature=0.2,
+        max_temperature=3.0,
+        temperatures=None,
+        exchange_interval=100,
+        max_steps=10000,
+        workers=None,
+        **kwargs,
+    ):
+        super().__init__(initial_state, **kwargs)
+        if temperatures is None:
+            temperatures = np.geomspace(min_temperature, max_temperature, replicas)
+        self.temperatures = [float(t) for t in temperatures]
+        self.exchange_interval = exchange_interval
+        self.max_steps = max_steps
+        self.workers = workers
+        self.entropy = np.random.SeedSequence(self.seed).entropy
+        self.current_step = 0
+        self.current_round = 0
+        self.replicas = None
+        self.ladder = None
+        self.energies = None
+        self.best_state = None
+        self.swap_attempts = [0] * (len(self.temperatures) - 1)
+        self.swap_accepts = [0] * (len(self.temperatures) - 1)
+        self._group = None
+        self._workers = []
+
+    @property
+    def swap_acceptance_rates(self):
+        """Fraction of accepted swaps between rung i and rung i + 1"""
+        return [
+            accepts / attempts if attempts else 0.0
+            for accepts, attempts in zip(self.swap_accepts, self.swap_attempts)
+        ]
+
+    def _replica_seed(self, replica):
+        sequence = np.random.SeedSequence(
+            self.entropy, spawn_key=(self.current_round, replica)
+        )
+        return int(sequence.generate_state(1, np.uint64)[0])
+
+    def _start_replicas(self):
+        """Copy the initial state into every replica and place the replicas"""
+        states = [self.state.copy() for _ in self.temperatures]
+        self.ladder = list(range(len(states)))
+        self.energies = [state.value for state in states]
+        self.best_state = self.state.copy()
+
+        workers = min(self.workers or 1, len(states))
+        if workers <= 1:
+            self._group = _ReplicaGroup(dict(enumerate(states)))
+            return
+        for worker in range(workers):
+            owned = range(worker, len(states), workers)
+            connection, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve_replicas,
+                args=(child, {replica: states[replica] for replica in owned}),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._workers.append((process, connection, set(owned)))
+
+    def _run_round(self, assignments, steps, best_value):
+        """Run one round on every replica, wherever it lives"""
+        if not self._workers:
+            return self._group.run(assignments, steps, self.stop_at, best_value)
+        for _, connection, owned in self._workers:
+            mine = [assignment for assignment in assignments if assignment[0] in owned]
+            connection.send((mine, steps, self.stop_at, best_value))
+        results = {}
+        for _, connection, _ in self._workers:
+            result = connection.recv()
+            if isinstance(result, Exception):
+                raise result
+            results.update(result)
+        return results
+
+    def _collect_replicas(self):
+        """Gather the final replica states, ordered by rung"""
+        if self._workers:
+            states = {}
+            for process, connection, _ in self._workers:
+                connection.send(None)
+                states.update(connection.recv())
+                process.join()
+            self._workers = []
+        else:
+            states = self._group.states
+        self.replicas = [states[replica] for replica in self.ladder]
+
+    def _stop_workers(self):
+        for process, connection, _ in self._workers:
+            connection.close()
+            process.terminate()
+            process.join()
+        self._workers = []
+        self._group = None
+
+    def _exchange(self):
+        """Attempt Metropolis swaps of the temperatures of adjacent rungs"""
+        ladder = self.ladder
+        energies = self.energies
+        temperatures = self.temperatures
+        for i in range(self.current_round % 2, len(ladder) - 1, 2):
+            exponent = (1 / temperatures[i] - 1 / temperatures[i + 1]) * (
+                energies[ladder[i]] - energies[ladder[i + 1]]
+            )
+            self.swap_attempts[i] += 1
+            if exponent >= 0 or self.rng.log_random() < exponent:
+                ladder[i], ladder[i + 1] = ladder[i + 1], ladder[i]
+                self.swap_accepts[i] += 1
+
+    def progress(self):
+        """A `ProgressRecord` of the coldest replica"""
+        return ProgressRecord(
+            self.current_step,
+            self.energies[self.ladder[0]],
+            self.best_state.value,
+            self.temperatures[0],
+        )
+
+    def step(self):
+        """
+        Runs every replica for one exchange interval, then attempts swaps.
+        Returns False once a goal state has been found.
+        """
+        if self.ladder is None:
+            self._start_replicas()
+
+        steps = min(self.exchange_interval, self.max_steps - self.current_step)
+        assignments = [
+            (replica, temperature, self._replica_seed(rung))
+            for rung, (replica, temperature) in enumerate(
+                zip(self.ladder, self.temperatures)
+            )
+        ]
+        results = self._run_round(assignments, steps, self.best_state.value)
+
+        self.current_step += steps
+        self.current_round += 1
+        for replica in self.ladder:
+            energy, evaluations, best_state = results[replica]
+            self.energies[replica] = energy
+            self.evaluations += evaluations
+            if best_state is not None and best_state.value < self.best_state.value:
+                self.best_state = best_state
+
+        if self.best_state.is_goal():
+            return False
+
+        self._exchange()
+        return True
+
+    def iter_search(self, every=1):
+        """
+        Executes parallel tempering until a goal is found or every replica
+        has made `max_steps` steps. Returns the best state seen.
+        """
+        self.current_step = 0
+        self.current_round = 0
+        self.replicas = None
+        self.ladder = None
+
+        step = self.stepper()
+        countdown = every
+        try:
+            while self.current_step < self.max_steps:
+                if not step():
+                    break
+
+                countdown -= 1
+                if countdown == 0:
+                    countdown = every
+                    yield self.progress()
+            if self.ladder is not None:
+                self._collect_replicas()
+        finally:
+            self._stop_workers()
+
+        if self.best_state is None:
+            self.best_state = self.state.copy()
+        self.state = self.best_state
+        return self.finish(self.best_state)
+
+    def reset(self):
+        super().reset()
+        self.replicas = None
+        self.ladder = None
+        self.energies = None
+        self.best_state = None
@@ -1,6 +1,7 @@
-import random
 from abc import abstractmethod
-from ..search_algorithm import SearchAlgorithm
+from array import array
+from ..search_algorithm import SearchAlgorithm, with_clock
+from .checkpoint import read_checkpoint, write_checkpoint
 from .cooling_strategy import ExponentialCooling
 
 
@@ -8,6 +9,13 @@ class SimulatedAnnealing(SearchAlgorithm):
     """
     Simulated Annealing algorithm implementation.
     Uses temperature-based probability to accept worse moves.
+    The best state visited is kept in `best_state` and returned by `search`.
+
+    With `checkpoint_path`, the run is checkpointed about every
+    `checkpoint_interval` seconds and when it ends: step, temperature, RNG
+    state, cooling strategy state, current and best states. `resume(path)`
+    loads a checkpoint so the next `search` continues exactly where it left
+    off. States must provide `to_config` and `from_config`.
     """
 
     def __init__(
@@ -18,6 +26,8 @@ class SimulatedAnnealing(SearchAlgorithm):
         min_temperature=1e-8,
         max_steps=10000,
         cooling_strategy=None,
+        checkpoint_path=None,
+        checkpoint_interval=5.0,
         **kwargs,
     ):
         super().__init__(initial_state, **kwargs)
@@ -27,6 +37,12 @@ class SimulatedAnnealing(SearchAlgorithm):
         self.min_temperature = min_temperature
         self.max_steps = max_steps
         self.current_step = 0
+        self.best_state = None
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self._resumed = False
+        self._cooling_state = None
+        self._feedback = None
 
         if cooling_strategy is not None:
             self.cooling_strategy = cooling_strategy
@@ -41,6 +57,19 @@ class SimulatedAnnealing(SearchAlgorithm):
         """
         pass
 
+    def is_improvement(self, value, best_value):
+        """True if `value` is better than `best_value`; minimizes by default"""
+        return value < best_value
+
+    def accepts(self, energy_delta, temperature):
+        """
+        Decide whether to take a move with the given energy delta.
+        Subclasses may override this with a cheaper equivalent test.
+        """
+        return self.rng.random() < self.acceptance_probability(
+            energy_delta, temperature
+        )
+
     def cool_down(self):
         """Apply cooling strategy to reduce temperature."""
         self.temperature = self.cooling_strategy.cool(
@@ -49,47 +78,130 @@ class SimulatedAnnealing(SearchAlgorithm):
             initial_temperature=self.initial_temperature,
         )
 
+    def checkpoint(self, path=None):
+        """Write the run's current progress to `path` or `checkpoint_path`"""
+        rng_state = self.rng.getstate()
+        header = {
+            "algorithm": type(self).__name__,
+            "step": self.current_step,
+            "temperature": self.temperature,
+            "evaluations": self.evaluations,
+            "accepted_moves": self.accepted_moves,
+            "rng": rng_state["bit_generator"],
+            "cooling": self.cooling_strategy.state_dict(),
+        }
+        arrays = {
+            "state": self.state.to_config(),
+            "best_state": self.best_state.to_config(),
+            "uniforms": array("d", rng_state["uniforms"]),
+            "log_uniforms": array("d", rng_state["log_uniforms"]),
+        }
+        write_checkpoint(path or self.checkpoint_path, header, arrays)
+
+    def resume(self, path):
+        """Load a checkpoint; the next `search` continues from it"""
+        header, arrays = read_checkpoint(path)
+        if header["algorithm"] != type(self).__name__:
+            raise ValueError(
+                f"Checkpoint {path} was written by {header['algorithm']}, "
+                f"not {type(self).__name__}"
+            )
+        self.state = self.state.from_config(arrays["state"])
+        self.best_state = self.state.from_config(arrays["best_state"])
+        self.current_step = header["step"]
+        self.temperature = header["temperature"]
+        self.evaluations = header["evaluations"]
+        self.accepted_moves = header["accepted_moves"]
+        self.rng.setstate(
+            {
+                "bit_generator": header["rng"],
+                "uniforms": arrays["uniforms"],
+                "log_uniforms": arrays["log_uniforms"],
+            }
+        )
+        self._cooling_state = header["cooling"]
+        self._resumed = True
+
+    def _with_checkpoints(self, step):
+        """Wrap `step` to checkpoint about every `checkpoint_interval` seconds"""
+        due = None
+
+        def maybe_checkpoint(now):
+            nonlocal due
+            if due is None:
+                due = now + self.checkpoint_interval
+            elif now >= due:
+                self.checkpoint()
+                due = now + self.checkpoint_interval
+            return True
+
+        return with_clock(step, maybe_checkpoint)
+
     def step(self):
         """
         Performs one step of simulated annealing.
         Returns True if a move was made, False if no neighbors available.
         """
-        neighbors = self.state.neighbors
-        if not neighbors:
+        state = self.state
+        move = state.random_move(self.rng)
+        if move is None:
             return False
 
-        current_value = self.state.value
-        neighbor = random.choice(neighbors)
-        neighbor_value = neighbor.value
-
-        energy_delta = neighbor_value - current_value
-        probability = self.acceptance_probability(energy_delta, self.temperature)
-
-        if random.random() < probability:
-            self.state = neighbor
+        energy_delta = state.move_value(move) - state.value
+        self.evaluations += 1
+        accepted = self.accepts(energy_delta, self.temperature)
+        if self._feedback is not None:
+            self._feedback(energy_delta, accepted)
+        if accepted:
+            state.apply(move)
+            self.accepted_moves += 1
+            if self.is_improvement(state.value, self.best_state.value):
+                self.best_state = state.copy()
 
         return True
 
-    def search(self):
+    def iter_search(self, every=1):
         """
         Executes the simulated annealing search.
-        Returns the final state found.
+        Returns the best state visited.
         """
-        self.current_step = 0
-        self.temperature = self.initial_temperature
+        if self._resumed:
+            self._resumed = False
+            self.cooling_strategy.load_state(self, self._cooling_state)
+        else:
+            self.current_step = 0
+            self.best_state = self.state.copy()
+            estimate = self.cooling_strategy.prepare(self)
+            self.temperature = (
+                self.initial_temperature if estimate is None else estimate
+            )
+        if self.cooling_strategy.feedback:
+            self._feedback = self.cooling_strategy.observe
+        else:
+            self._feedback = None
+        step = self.stepper()
+        if self.checkpoint_path is not None:
+            step = self._with_checkpoints(step)
 
+        countdown = every
         while (
             self.current_step < self.max_steps
             and self.temperature > self.min_temperature
         ):
             if self.state.is_goal():
-                return self.state
+                break
 
-            made_move = self.step()
+            made_move = step()
             if not made_move:
                 break
 
             self.cool_down()
             self.current_step += 1
-
-        return self.state
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield self.progress()
+
+        if self.checkpoint_path is not None:
+            self.checkpoint()
+        return self.finish(self.best_state)
@@ -0,0 +1,169 @@
+from collections import deque
+import numpy as np
+from ..games.state import UnsupportedStateError
+from ..search_algorithm import SearchAlgorithm
+
+
+class TabuSearch(SearchAlgorithm):
+    """
+    Tabu search for minimization problems.
+    Assumes `state` provides `zobrist` and `move_zobrist(move)`, plus
+    optionally `undo_move(move)`.
+
+    Every step takes the best admissible move, even when it is worse than
+    the current state. A move is not admissible if it is on the short-term
+    tabu list, which holds the moves undoing the last `tenure` steps, or if
+    it leads to a state in the long-term memory of visited Zobrist hashes.
+    That memory keeps the last `max_visited` states and evicts the oldest
+    first. Aspiration overrides both when a move beats the best value seen.
+
+    Moves are ranked with `move_value_matrix` when the state provides it,
+    looking at the `candidates` best first and only sorting the whole
+    neighborhood when all of them are rejected. The best state seen is
+    returned.
+    """
+
+    def __init__(
+        self,
+        initial_state,
+        max_steps=1000,
+        tenure=10,
+        max_visited=100000,
+        candidates=64,
+        vectorized=True,
+        **kwargs,
+    ):
+        super().__init__(initial_state, **kwargs)
+        for hook in ("zobrist", "move_zobrist"):
+            if not hasattr(self.state, hook):
+                raise UnsupportedStateError(
+                    f"TabuSearch requires a state with '{hook}', "
+                    f"got {type(self.state).__name__}"
+                )
+        self.max_steps = max_steps
+        self.tenure = tenure
+        self.max_visited = max_visited
+        self.candidates = candidates
+        self.vectorized = vectorized
+        self.current_step = 0
+        self._clear_memory()
+
+    def _clear_memory(self):
+        self.best_state = self.state.copy()
+        self._tabu = deque()
+        self._tabu_counts = {}
+        self._visited_order = deque()
+        self._visited = set()
+        self._remember(self.state.zobrist)
+
+    def _make_tabu(self, move):
+        if self.tenure <= 0:
+            return
+        if len(self._tabu) == self.tenure:
+            expired = self._tabu.popleft()
+            count = self._tabu_counts[expired] - 1
+            if count:
+                self._tabu_counts[expired] = count
+            else:
+                del self._tabu_counts[expired]
+        self._tabu.append(move)
+        self._tabu_counts[move] = self._tabu_counts.get(move, 0) + 1
+
+    def _remember(self, zobrist):
+        if self.max_visited <= 0 or zobrist in self._visited:
+            return
+        if len(self._visited_order) == self.max_visited:
+            self._visited.discard(self._visited_order.popleft())
+        self._visited_order.append(zobrist)
+        self._visited.add(zobrist)
+
+    def _ranked_moves(self):
+        """Yield (move, value) pairs from best to worst value"""
+        state = self.state
+        if self.vectorized and hasattr(state, "move_value_matrix"):
+            values = state.move_value_matrix()
+            self.evaluations += values.size
+            flat = values.ravel()
+            non_move = np.iinfo(values.dtype).max
+            k = min(self.candidates, len(flat))
+            if k == 0:
+                return
+            head = np.argpartition(flat, k - 1)[:k]
+            head = head[np.lexsort((head, flat[head]))]
+            for index in head:
+                if flat[index] == non_move:
+                    return
+                yield self._unravel(index, values.shape), int(flat[index])
+            if k == len(flat):
+                return
+            for index in np.argsort(flat, kind="stable"):
+                if flat[index] == non_move:
+                    return
+                if index not in head:
+                    yield self._unravel(index, values.shape), int(flat[index])
+            return
+
+        ranked = [(move, state.move_value(move)) for move in state.iter_moves()]
+        self.evaluations += len(ranked)
+        ranked.sort(key=lambda item: item[1])
+        yield from ranked
+
+    @staticmethod
+    def _unravel(index, shape):
+        return tuple(int(i) for i in np.unravel_index(index, shape))
+
+    def _admissible(self, move, value):
+        if value < self.best_state.value:
+            return True
+        if move in self._tabu_counts:
+            return False
+        return self.state.move_zobrist(move) not in self._visited
+
+    def step(self):
+        """
+        Applies the best admissible move.
+        Returns False if every move is tabu or leads to a visited state.
+        """
+        state = self.state
+        for move, value in self._ranked_moves():
+            if not self._admissible(move, value):
+                continue
+
+            if hasattr(state, "undo_move"):
+                self._make_tabu(state.undo_move(move))
+            else:
+                self._make_tabu(move)
+            state.apply(move)
+            self._remember(state.zobrist)
+            if state.value < self.best_state.value:
+                self.best_state = state.copy()
+            return True
+
+        return False
+
+    def iter_search(self, every=1):
+        """
+        Executes tabu search until a goal is found, no move is admissible or
+        `max_steps` moves have been made. Returns the best state seen.
+        """
+        self.current_step = 0
+        self._clear_memory()
+        step = self.stepper()
+        countdown = every
+        while self.current_step < self.max_steps:
+            if self.state.is_goal():
+                break
+
+            if not step():
+                break
+
+            self.current_step += 1
+            countdown -= 1
+            if countdown == 0:
+                countdown = every
+                yield self.progress()
+        return self.finish(self.best_state)
+
+    def reset(self):
+        super().reset()
+        self._clear_memory()
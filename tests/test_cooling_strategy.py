@@ -0,0 +1,28 @@
+import unittest
+from local_search.games.n_queens import NQueensState
+from local_search.local_search import LocalSearch
+
+
+class AdaptiveCoolingTest(unittest.TestCase):
+    def test_runs_without_uphill_samples(self):
+        # Every move from the all-zeros board is downhill, so `prepare` has
+        # nothing to calibrate on
+        search = LocalSearch(
+            NQueensState([0] * 40),
+            algorithm_name="minimization_sa",
+            cooling_strategy="adaptive",
+            max_steps=20000,
+            seed=1,
+        )
+        strategy = search.algorithm.cooling_strategy
+
+        final_state = search.search()
+
+        self.assertEqual(strategy.initial_temperature, 1000)
+        self.assertIsNotNone(strategy.acceptance_rate)
+        self.assertLessEqual(search.algorithm.temperature, 1000)
+        self.assertLess(final_state.value, NQueensState([0] * 40).value)
+
+
+if __name__ == "__main__":
+    unittest.main()